@@ -3,15 +3,25 @@
 
 Usage:
     uv run python scripts/benchmark.py --base-url http://localhost:8000 --concurrency 10 --requests 100
+
+HTTP/2 is used against https targets when `h2` is available (pip install "httpx[http2]").
 """
 
 import argparse
 import asyncio
-import statistics
+import bisect
+import importlib.util
+import math
 import time
+from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import uvloop
+except ImportError:  # optional - fall back to the default asyncio loop
+    uvloop = None
+
 ENDPOINTS = [
     ("/api/v1/recommendations/homepage", {"user_id": "user-001", "limit": "12"}),
     ("/api/v1/recommendations/product/prod-001", {"limit": "8"}),
@@ -21,45 +31,148 @@ ENDPOINTS = [
     ("/api/v1/health", {}),
 ]
 
-
-async def make_request(
-    client: httpx.AsyncClient, url: str, params: dict
-) -> tuple[str, float, int]:
-    start = time.perf_counter()
-    try:
-        resp = await client.get(url, params=params)
-        duration = time.perf_counter() - start
-        return url, duration, resp.status_code
-    except Exception:
-        duration = time.perf_counter() - start
-        return url, duration, 0
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class P2Quantile:
+    """Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+
+    Keeps five markers instead of every sample, so memory and per-update cost are O(1)
+    regardless of how many requests the run issues.
+    """
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.heights: list[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        q = self.heights
+        if len(q) < 5:
+            bisect.insort(q, x)
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(q, x) - 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                # Piecewise-parabolic prediction, falling back to linear if it overshoots
+                candidate = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def value(self) -> float:
+        q = self.heights
+        if len(q) < 5:
+            return q[min(int(len(q) * self.p), len(q) - 1)] if q else math.nan
+        return q[2]
+
+
+class LatencyTracker:
+    """Running count/sum/min/max plus streaming p50/p95 for one endpoint."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.p50 = P2Quantile(0.50)
+        self.p95 = P2Quantile(0.95)
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.p50.add(duration)
+        self.p95.add(duration)
 
 
 async def run_benchmark(base_url: str, concurrency: int, total_requests: int) -> None:
-    results: dict[str, list[float]] = {ep[0]: [] for ep in ENDPOINTS}
-    errors: dict[str, int] = {ep[0]: 0 for ep in ENDPOINTS}
-
-    sem = asyncio.Semaphore(concurrency)
-
-    async def bounded_request(client: httpx.AsyncClient, path: str, params: dict) -> None:
-        async with sem:
-            url = f"{base_url}{path}"
-            _, duration, status = await make_request(client, url, params)
-            if 200 <= status < 300:
-                results[path].append(duration)
+    # Per-endpoint state lives in lists indexed by ENDPOINTS position; full URLs are
+    # built once so workers only time the request and bucket the result
+    paths = [ep[0] for ep in ENDPOINTS]
+    params_list = [ep[1] for ep in ENDPOINTS]
+    urls = [base_url + path for path in paths]
+    trackers = [LatencyTracker() for _ in ENDPOINTS]
+    errors = [0] * len(ENDPOINTS)
+
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(total_requests):
+        queue.put_nowait(i % len(ENDPOINTS))
+
+    perf_counter = time.perf_counter
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while True:
+            try:
+                idx = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            # Time to response headers; the body is drained raw (no decoding or buffering)
+            # afterwards so the keep-alive connection returns to the pool
+            start = perf_counter()
+            try:
+                async with client.stream("GET", urls[idx], params=params_list[idx]) as resp:
+                    duration = perf_counter() - start
+                    status = resp.status_code
+                    async for _ in resp.aiter_raw():
+                        pass
+            except Exception:
+                duration = perf_counter() - start
+                status = 0
+            if status // 100 == 2:
+                trackers[idx].add(duration)
             else:
-                errors[path] += 1
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        tasks = []
-        for i in range(total_requests):
-            path, params = ENDPOINTS[i % len(ENDPOINTS)]
-            tasks.append(bounded_request(client, path, params))
-
+                errors[idx] += 1
+
+    # Size the pool to the requested concurrency so bursts reuse keep-alive sockets
+    limits = httpx.Limits(
+        max_connections=max(concurrency * 2, 100),
+        max_keepalive_connections=max(concurrency, 20),
+        keepalive_expiry=60.0,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, http2=HTTP2, retries=0)
+    async with httpx.AsyncClient(timeout=30.0, transport=transport) as client:
         overall_start = time.perf_counter()
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(concurrency):
+                tg.create_task(worker(client))
         overall_duration = time.perf_counter() - overall_start
 
+        # Fetch server-side profile if available, reusing the warm pooled connection
+        profile = None
+        try:
+            resp = await client.get(f"{base_url}/api/v1/benchmarks/profile", timeout=5.0)
+            if resp.status_code == 200:
+                profile = resp.json()
+        except Exception:
+            pass
+
     # Print report
     print(f"\n{'=' * 70}")
     print("REEMIO RECOMMENDER - BENCHMARK REPORT")
@@ -68,40 +181,34 @@ async def run_benchmark(base_url: str, concurrency: int, total_requests: int) ->
     print(f"Total time: {overall_duration:.2f}s | RPS: {total_requests / overall_duration:.1f}")
     print(f"{'=' * 70}\n")
 
-    for path, latencies in results.items():
-        if not latencies:
-            print(f"{path}: No successful requests (errors: {errors[path]})")
+    for idx, path in enumerate(paths):
+        tracker = trackers[idx]
+        # Endpoints sharing a path (e.g. two search queries) are told apart by params
+        label = path if paths.count(path) == 1 else f"{path}?{urlencode(params_list[idx])}"
+        if not tracker.count:
+            print(f"{label}: No successful requests (errors: {errors[idx]})")
             continue
-        sorted_lat = sorted(latencies)
-        p95_idx = min(int(len(sorted_lat) * 0.95), len(sorted_lat) - 1)
-        print(f"{path}")
-        print(f"  Requests : {len(latencies)} OK, {errors[path]} errors")
-        print(f"  Avg      : {statistics.mean(latencies) * 1000:.1f}ms")
-        print(f"  P50      : {statistics.median(latencies) * 1000:.1f}ms")
-        print(f"  P95      : {sorted_lat[p95_idx] * 1000:.1f}ms")
-        print(f"  Min/Max  : {min(latencies) * 1000:.1f}ms / {max(latencies) * 1000:.1f}ms")
+        print(f"{label}")
+        print(f"  Requests : {tracker.count} OK, {errors[idx]} errors")
+        print(f"  Avg      : {tracker.total / tracker.count * 1000:.1f}ms")
+        print(f"  P50      : {tracker.p50.value() * 1000:.1f}ms")
+        print(f"  P95      : {tracker.p95.value() * 1000:.1f}ms")
+        print(f"  Min/Max  : {tracker.min * 1000:.1f}ms / {tracker.max * 1000:.1f}ms")
         print()
 
-    # Fetch server-side profile if available
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{base_url}/api/v1/benchmarks/profile")
-            if resp.status_code == 200:
-                profile = resp.json()
-                print(f"{'=' * 70}")
-                print("SERVER-SIDE PROFILE")
-                print(f"{'=' * 70}")
-                res = profile.get("system_resources", {})
-                print(f"  CPU      : {res.get('cpu_percent', 'N/A')}%")
-                print(f"  Memory   : {res.get('memory_rss_mb', 'N/A')} MB RSS")
-                print(f"  Threads  : {res.get('threads', 'N/A')}")
-                pool = profile.get("database_pool", {})
-                print(f"  DB Pool  : {pool.get('checked_out', 'N/A')} out / {pool.get('pool_size', 'N/A')} size")
-                cache = profile.get("cache_status", {})
-                print(f"  Cache    : {'connected' if cache.get('connected') else 'disconnected'}")
-                print()
-    except Exception:
-        pass
+    if profile is not None:
+        print(f"{'=' * 70}")
+        print("SERVER-SIDE PROFILE")
+        print(f"{'=' * 70}")
+        res = profile.get("system_resources", {})
+        print(f"  CPU      : {res.get('cpu_percent', 'N/A')}%")
+        print(f"  Memory   : {res.get('memory_rss_mb', 'N/A')} MB RSS")
+        print(f"  Threads  : {res.get('threads', 'N/A')}")
+        pool = profile.get("database_pool", {})
+        print(f"  DB Pool  : {pool.get('checked_out', 'N/A')} out / {pool.get('pool_size', 'N/A')} size")
+        cache = profile.get("cache_status", {})
+        print(f"  Cache    : {'connected' if cache.get('connected') else 'disconnected'}")
+        print()
 
 
 def main() -> None:
@@ -111,7 +218,8 @@ def main() -> None:
     parser.add_argument("--requests", type=int, default=100)
     args = parser.parse_args()
 
-    asyncio.run(run_benchmark(args.base_url, args.concurrency, args.requests))
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(run_benchmark(args.base_url, args.concurrency, args.requests))
 
 
 if __name__ == "__main__":
@@ -1,47 +1,14 @@
 #!/usr/bin/env python3
 """Script to generate the EDA Jupyter notebook."""
 
-import json
+import orjson
 
-# Create notebook structure
-notebook = {
-    "cells": [],
-    "metadata": {
-        "kernelspec": {
-            "display_name": "Python 3",
-            "language": "python",
-            "name": "python3"
-        },
-        "language_info": {
-            "name": "python",
-            "version": "3.13"
-        }
-    },
-    "nbformat": 4,
-    "nbformat_minor": 5
-}
-
-# Helper functions
-def add_markdown(text):
-    notebook["cells"].append({
-        "cell_type": "markdown",
-        "metadata": {},
-        "source": text.split("\n")
-    })
-
-def add_code(code):
-    notebook["cells"].append({
-        "cell_type": "code",
-        "execution_count": None,
-        "metadata": {},
-        "outputs": [],
-        "source": code.split("\n")
-    })
-
-# ============================================================================
-# TITLE
-# ============================================================================
-add_markdown("""# Reemio Recommendation System - EDA Notebook
+# Notebook content as (kind, source) pairs, in display order
+CELLS = [
+    # ============================================================================
+    # TITLE
+    # ============================================================================
+    ("md", """# Reemio Recommendation System - EDA Notebook
 
 **Exploratory Data Analysis** of the hybrid recommendation system with product embeddings, user preferences, and collaborative filtering.
 
@@ -49,46 +16,33 @@ add_markdown("""# Reemio Recommendation System - EDA Notebook
 **Sections**: 11 comprehensive sections from data connection to final insights
 
 **Author**: Reemio Data Science Team
-**Last Updated**: 2026-01-29""")
+**Last Updated**: 2026-01-29"""),
 
-# ============================================================================
-# SECTION 1: Setup & Data Connection
-# ============================================================================
-add_markdown("""## Section 1: Setup & Data Connection
+    # ============================================================================
+    # SECTION 1: Setup & Data Connection
+    # ============================================================================
+    ("md", """## Section 1: Setup & Data Connection
 
 **Goal**: Connect to PostgreSQL database and load necessary libraries
 
-This section establishes the database connection and loads all required Python libraries for data analysis and visualization.""")
+This section establishes the database connection and loads the core data libraries; plotting and ML libraries are imported by the sections that need them."""),
 
-add_code("""# Standard imports
+    ("code", """# Standard imports (plotting and ML libraries are imported by the sections that use them)
 import os
-import json
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
-from sklearn.manifold import TSNE
-from sklearn.metrics.pairwise import cosine_similarity
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configure matplotlib
-%matplotlib inline
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 6)
-
 # Configure pandas display
 pd.set_option('display.max_columns', None)
 pd.set_option('display.max_rows', 100)
 
-print("✅ All libraries loaded successfully")""")
+print("✅ All libraries loaded successfully")"""),
 
-add_code("""# Database connection
+    ("code", """# Database connection
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -99,17 +53,25 @@ if not DATABASE_URL:
 engine = create_engine(DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://"))
 
 # Helper function to query database
-def query_db(sql, params=None):
-    \"\"\"Execute SQL query and return pandas DataFrame\"\"\"
+def query_db(sql, params=None, chunksize=None):
+    \"\"\"Execute SQL query and return pandas DataFrame
+
+    With chunksize, rows stream from a server-side cursor in batches instead of
+    being buffered client-side all at once.
+    \"\"\"
     with engine.connect() as conn:
-        return pd.read_sql(text(sql), conn, params=params or {})
+        if chunksize is None:
+            return pd.read_sql(text(sql), conn, params=params or {})
+        conn = conn.execution_options(stream_results=True, max_row_buffer=chunksize)
+        chunks = pd.read_sql(text(sql), conn, params=params or {}, chunksize=chunksize)
+        return pd.concat(chunks, ignore_index=True)
 
 # Test connection
 test_result = query_db("SELECT COUNT(*) as count FROM recommender.product_embeddings")
 print(f"✅ Database connected successfully")
-print(f"Total products in database: {test_result['count'].iloc[0]:,}")""")
+print(f"Total products in database: {test_result['count'].iloc[0]:,}")"""),
 
-add_code("""# Display schema information
+    ("code", """# Display schema information
 schema_info = query_db(\"\"\"
     SELECT
         table_name,
@@ -120,12 +82,12 @@ schema_info = query_db(\"\"\"
 \"\"\")
 
 print("\\n📊 Tables in recommender schema:")
-display(schema_info)""")
+display(schema_info)"""),
 
-# ============================================================================
-# SECTION 2: Product Catalog Analysis
-# ============================================================================
-add_markdown("""## Section 2: Product Catalog Analysis
+    # ============================================================================
+    # SECTION 2: Product Catalog Analysis
+    # ============================================================================
+    ("md", """## Section 2: Product Catalog Analysis
 
 **Goal**: Understand the 3000-product catalog structure, pricing, categories, and stock levels
 
@@ -133,9 +95,9 @@ We'll analyze:
 - Product distribution across categories
 - Price ranges and tiers
 - Stock availability
-- Active vs. inactive products""")
+- Active vs. inactive products"""),
 
-add_code("""# Load product data
+    ("code", """# Load product data
 products_df = query_db(\"\"\"
     SELECT
         external_product_id,
@@ -148,7 +110,7 @@ products_df = query_db(\"\"\"
         created_at,
         embedding_updated_at
     FROM recommender.product_embeddings
-\"\"\")
+\"\"\", chunksize=1000)
 
 print(f"Total products loaded: {len(products_df):,}")
 products_df['price'] = products_df['price_cents'] / 100
@@ -161,9 +123,20 @@ print(f"  Price range: ${products_df['price'].min():.2f} - ${products_df['price'
 print(f"  Average price: ${products_df['price'].mean():.2f}")
 print(f"  Median stock: {products_df['stock'].median():.0f}")
 
-products_df.head()""")
+products_df.head()"""),
 
-add_code("""# Category distribution
+    ("code", """# Plotting libraries
+import matplotlib.pyplot as plt
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Configure matplotlib
+%matplotlib inline
+plt.style.use('seaborn-v0_8-darkgrid')
+plt.rcParams['figure.figsize'] = (12, 6)
+
+# Category distribution
 category_counts = products_df['category'].value_counts().head(15)
 
 fig = px.bar(
@@ -176,9 +149,9 @@ fig = px.bar(
     color_continuous_scale='viridis'
 )
 fig.update_layout(showlegend=False, height=500)
-fig.show()""")
+fig.show()"""),
 
-add_code("""# Price distribution
+    ("code", """# Price distribution
 fig = make_subplots(
     rows=1, cols=2,
     subplot_titles=('Price Distribution', 'Price by Top 10 Categories')
@@ -205,9 +178,9 @@ fig.update_xaxes(title_text="Price ($)", row=1, col=1)
 fig.update_yaxes(title_text="Frequency", row=1, col=1)
 fig.update_yaxes(title_text="Price ($)", row=1, col=2)
 fig.update_layout(height=500, showlegend=False, title_text="Product Pricing Analysis")
-fig.show()""")
+fig.show()"""),
 
-add_code("""# Price tiers
+    ("code", """# Price tiers
 products_df['price_tier'] = pd.cut(
     products_df['price'],
     bins=[0, 25, 100, 500, float('inf')],
@@ -224,9 +197,9 @@ fig = px.pie(
     title='Products by Price Tier',
     hole=0.4
 )
-fig.show()""")
+fig.show()"""),
 
-add_code("""# Stock analysis
+    ("code", """# Stock analysis
 print("\\n📦 Stock Analysis:")
 print(f"  Products in stock: {(products_df['stock'] > 0).sum():,}")
 print(f"  Out of stock: {(products_df['stock'] == 0).sum():,}")
@@ -240,18 +213,18 @@ fig = px.histogram(
     title='Stock Level Distribution (capped at 200 for visibility)',
     labels={'stock': 'Stock Level', 'count': 'Number of Products'}
 )
-fig.show()""")
+fig.show()"""),
 
-# ============================================================================
-# SECTION 3: User Interaction Patterns (if data exists)
-# ============================================================================
-add_markdown("""## Section 3: User Interaction Patterns
+    # ============================================================================
+    # SECTION 3: User Interaction Patterns (if data exists)
+    # ============================================================================
+    ("md", """## Section 3: User Interaction Patterns
 
 **Goal**: Analyze user behavior, interaction types, and conversion funnels
 
-**Note**: This section requires interaction data. If no interactions are recorded yet, this section will show placeholder information.""")
+**Note**: This section requires interaction data. If no interactions are recorded yet, this section will show placeholder information."""),
 
-add_code("""# Check if interactions data exists
+    ("code", """# Check if interactions data exists
 interaction_count_result = query_db("SELECT COUNT(*) as count FROM recommender.user_interactions")
 interaction_count = interaction_count_result['count'].iloc[0]
 
@@ -268,9 +241,9 @@ if interaction_count == 0:
     HAS_INTERACTIONS = False
 else:
     print(f"✅ Found {interaction_count:,} interactions to analyze")
-    HAS_INTERACTIONS = True""")
+    HAS_INTERACTIONS = True"""),
 
-add_code("""# Load interactions (if available)
+    ("code", """# Load interactions (if available)
 if HAS_INTERACTIONS:
     interactions_df = query_db(\"\"\"
         SELECT
@@ -283,7 +256,7 @@ if HAS_INTERACTIONS:
         FROM recommender.user_interactions
         ORDER BY created_at DESC
         LIMIT 10000
-    \"\"\")
+    \"\"\", chunksize=1000)
 
     print(f"Loaded {len(interactions_df):,} interactions")
 
@@ -302,9 +275,9 @@ if HAS_INTERACTIONS:
 
     display(interactions_df.head(10))
 else:
-    print("⏭️ Skipping detailed analysis - no data available")""")
+    print("⏭️ Skipping detailed analysis - no data available")"""),
 
-add_code("""# Conversion funnel analysis (if interactions exist)
+    ("code", """# Conversion funnel analysis (if interactions exist)
 if HAS_INTERACTIONS and interaction_count > 100:
     funnel_query = query_db(\"\"\"
         WITH funnel AS (
@@ -344,68 +317,65 @@ if HAS_INTERACTIONS and interaction_count > 100:
             textinfo="value+percent initial"
         ))
         fig.update_layout(title="Conversion Funnel: View → Cart → Purchase")
-        fig.show()""")
+        fig.show()"""),
 
-# Continue in next cell due to size...
-print(f"Created {len(notebook['cells'])} cells so far...")
-
-# ============================================================================
-# SECTION 4: Embeddings & Similarity Analysis
-# ============================================================================
-add_markdown("""## Section 4: Embeddings & Similarity Analysis
+    # ============================================================================
+    # SECTION 4: Embeddings & Similarity Analysis
+    # ============================================================================
+    ("md", """## Section 4: Embeddings & Similarity Analysis
 
 **Goal**: Understand product embeddings (384-dimensional vectors) and semantic similarity
 
 We'll explore:
 - Embedding coverage and quality
 - Product similarity patterns
-- t-SNE visualization showing category clustering
-- Semantic relationships between products""")
+- UMAP visualization showing category clustering
+- Semantic relationships between products"""),
 
-add_code("""# Load products with embeddings
+    ("code", """# Load products with embeddings
 embeddings_df = query_db(\"\"\"
     SELECT
         external_product_id,
         name,
         category,
         price_cents,
-        embedding
+        embedding::text AS embedding
     FROM recommender.product_embeddings
     WHERE embedding IS NOT NULL
     LIMIT 1000
-\"\"\")
+\"\"\", chunksize=1000)
 
 print(f"Loaded {len(embeddings_df):,} products with embeddings")
 
-# Parse JSON embeddings
-embeddings_df['embedding'] = embeddings_df['embedding'].apply(json.loads)
+# Parse '[x, y, ...]' text (JSON or pgvector) straight into float32 arrays in C
+embeddings_df['embedding'] = [
+    np.fromstring(s[1:-1], sep=',', dtype=np.float32) for s in embeddings_df['embedding']
+]
 
 # Check embedding dimension
 sample_embedding = embeddings_df['embedding'].iloc[0]
 print(f"Embedding dimension: {len(sample_embedding)}")
-print(f"Sample embedding (first 10 dims): {sample_embedding[:10]}")""")
+print(f"Sample embedding (first 10 dims): {sample_embedding[:10]}")"""),
+
+    ("code", """# Find similar products for a sample
+# Normalize once so cosine similarity is a single matrix-vector product per query
+normalized_embeddings = np.vstack(embeddings_df['embedding'].values).astype(np.float32)
+normalized_embeddings /= np.linalg.norm(normalized_embeddings, axis=1, keepdims=True)
 
-add_code("""# Find similar products for a sample
 def find_similar_products(product_idx, top_k=10):
     \"\"\"Find top-k most similar products to the given product.\"\"\"
-    embedding_matrix = np.array(embeddings_df['embedding'].tolist())
-    query_embedding = embedding_matrix[product_idx]
-
-    # Compute cosine similarity
-    similarities = cosine_similarity([query_embedding], embedding_matrix)[0]
+    similarities = normalized_embeddings @ normalized_embeddings[product_idx]
 
-    # Get top-k (excluding self)
-    top_indices = np.argsort(similarities)[::-1][1:top_k+1]
+    # Partial selection of the top-k (+1 for self), then order just those
+    top_indices = np.argpartition(-similarities, top_k)[:top_k + 1]
+    top_indices = top_indices[np.argsort(-similarities[top_indices])]
+    top_indices = top_indices[top_indices != product_idx][:top_k]
 
-    results = []
-    for idx in top_indices:
-        results.append({
-            'name': embeddings_df.iloc[idx]['name'],
-            'category': embeddings_df.iloc[idx]['category'],
-            'similarity': similarities[idx]
-        })
-
-    return pd.DataFrame(results)
+    return pd.DataFrame({
+        'name': embeddings_df['name'].values[top_indices],
+        'category': embeddings_df['category'].values[top_indices],
+        'similarity': similarities[top_indices]
+    })
 
 # Example: Find similar products
 sample_idx = 0
@@ -414,41 +384,41 @@ print(f"\\n🔍 Finding products similar to: {sample_product['name']}")
 print(f"   Category: {sample_product['category']}")
 
 similar_products = find_similar_products(sample_idx, top_k=10)
-display(similar_products)""")
+display(similar_products)"""),
 
-add_code("""# t-SNE visualization of product embeddings
-print("\\n📊 Generating t-SNE visualization (this may take 1-2 minutes)...")
+    ("code", """# UMAP visualization of product embeddings
+from sklearn.decomposition import PCA
+import umap
 
-# Sample products for faster computation
-sample_size = min(500, len(embeddings_df))
-sample_df = embeddings_df.sample(n=sample_size, random_state=42).reset_index(drop=True)
+print("\\n📊 Generating UMAP visualization...")
 
-# Create embedding matrix
-embedding_matrix = np.array(sample_df['embedding'].tolist())
+# Project every loaded product; PCA to 50-D first so UMAP's neighbour search is cheap
+sample_size = len(embeddings_df)
+embeddings_50d = PCA(n_components=50, random_state=42).fit_transform(normalized_embeddings)
 
-# Run t-SNE
-tsne = TSNE(n_components=2, random_state=42, perplexity=30)
-embeddings_2d = tsne.fit_transform(embedding_matrix)
+# Run UMAP (approximate nearest-neighbour graph, far faster than exact t-SNE)
+reducer = umap.UMAP(n_components=2, n_neighbors=30, random_state=42)
+embeddings_2d = reducer.fit_transform(embeddings_50d)
 
 # Create interactive plot
 fig = px.scatter(
     x=embeddings_2d[:, 0],
     y=embeddings_2d[:, 1],
-    color=sample_df['category'],
-    hover_data={'name': sample_df['name'], 'category': sample_df['category']},
-    title=f"t-SNE Visualization of Product Embeddings ({sample_size} products)",
-    labels={'x': 't-SNE Dimension 1', 'y': 't-SNE Dimension 2', 'color': 'Category'}
+    color=embeddings_df['category'],
+    hover_data={'name': embeddings_df['name'], 'category': embeddings_df['category']},
+    title=f"UMAP Visualization of Product Embeddings ({sample_size} products)",
+    labels={'x': 'UMAP Dimension 1', 'y': 'UMAP Dimension 2', 'color': 'Category'}
 )
 fig.update_traces(marker=dict(size=8, opacity=0.7))
 fig.update_layout(height=600)
 fig.show()
 
-print("\\n💡 Insight: Products of the same category should cluster together if embeddings are good!")""")
+print("\\n💡 Insight: Products of the same category should cluster together if embeddings are good!")"""),
 
-# ============================================================================
-# SECTION 5: User Preferences (if data exists)
-# ============================================================================
-add_markdown("""## Section 5: User Preference & Personalization
+    # ============================================================================
+    # SECTION 5: User Preferences (if data exists)
+    # ============================================================================
+    ("md", """## Section 5: User Preference & Personalization
 
 **Goal**: Analyze how user preferences are built from interaction history
 
@@ -460,9 +430,9 @@ add_markdown("""## Section 5: User Preference & Personalization
 - VIEW: 1.0
 - CART_REMOVE: -1.0
 
-**Recency Decay:** weight × exp(-days / 30)""")
+**Recency Decay:** weight × exp(-days / 30)"""),
 
-add_code("""# Check user preference data
+    ("code", """# Check user preference data
 pref_count_result = query_db("SELECT COUNT(*) as count FROM recommender.user_preference_embeddings")
 pref_count = pref_count_result['count'].iloc[0]
 
@@ -489,9 +459,9 @@ else:
     \"\"\")
 
     print("\\n👥 Top Users by Interaction Count:")
-    display(user_prefs_df)""")
+    display(user_prefs_df)"""),
 
-add_code("""# Visualize interaction weighting system
+    ("code", """# Visualize interaction weighting system
 import math
 
 interaction_weights = {
@@ -526,12 +496,12 @@ fig = px.line(
     labels={'x': 'Days Since Interaction', 'y': 'Weight Multiplier'}
 )
 fig.add_hline(y=0.5, line_dash="dash", line_color="red", annotation_text="50% weight")
-fig.show()""")
+fig.show()"""),
 
-# ============================================================================
-# SECTION 6: Hybrid Recommendation Algorithm
-# ============================================================================
-add_markdown("""## Section 6: Hybrid Recommendation Algorithm
+    # ============================================================================
+    # SECTION 6: Hybrid Recommendation Algorithm
+    # ============================================================================
+    ("md", """## Section 6: Hybrid Recommendation Algorithm
 
 **Goal**: Explain the 4-stage hybrid recommendation pipeline
 
@@ -541,9 +511,9 @@ add_markdown("""## Section 6: Hybrid Recommendation Algorithm
 3. **Reranking**: Cross-encoder for precise ordering (top 20)
 4. **Business Rules**: Diversity (max 3 per category), stock filtering
 
-This section demonstrates the algorithm with examples.""")
+This section demonstrates the algorithm with examples."""),
 
-add_code("""# Hybrid scoring demonstration
+    ("code", """# Hybrid scoring demonstration
 def hybrid_score(content_score, collaborative_score, popularity_score):
     \"\"\"Calculate hybrid score with tunable weights.\"\"\"
     alpha, beta, gamma = 0.5, 0.3, 0.2
@@ -558,10 +528,11 @@ example_candidates = pd.DataFrame([
     {'product': 'Product E', 'content': 0.40, 'collab': 0.80, 'popularity': 0.70},
 ])
 
-# Calculate hybrid scores
-example_candidates['hybrid_score'] = example_candidates.apply(
-    lambda row: hybrid_score(row['content'], row['collab'], row['popularity']),
-    axis=1
+# Calculate hybrid scores (column arithmetic - hybrid_score works on whole Series)
+example_candidates['hybrid_score'] = hybrid_score(
+    example_candidates['content'],
+    example_candidates['collab'],
+    example_candidates['popularity']
 )
 
 # Sort by hybrid score
@@ -586,38 +557,32 @@ fig.update_layout(
     barmode='group',
     height=500
 )
-fig.show()""")
-
-add_code("""# Visualize how different weights affect ranking
-alphas = [0.3, 0.5, 0.7]
-results = []
-
-for alpha in alphas:
-    beta = (1 - alpha) * 0.6  # 60% of remaining to collaborative
-    gamma = (1 - alpha) * 0.4  # 40% of remaining to popularity
-
-    scores = example_candidates.apply(
-        lambda row: alpha * row['content'] + beta * row['collab'] + gamma * row['popularity'],
-        axis=1
-    )
-
-    top_product = example_candidates.iloc[scores.argmax()]['product']
-    results.append({
-        'alpha': alpha,
-        'beta': round(beta, 2),
-        'gamma': round(gamma, 2),
-        'top_product': top_product
-    })
-
-results_df = pd.DataFrame(results)
+fig.show()"""),
+
+    ("code", """# Visualize how different weights affect ranking
+alphas = np.array([0.3, 0.5, 0.7])
+betas = (1 - alphas) * 0.6  # 60% of remaining to collaborative
+gammas = (1 - alphas) * 0.4  # 40% of remaining to popularity
+
+# Score every candidate under every weighting in one matmul: (5, 3) @ (3, 3)
+component_scores = example_candidates[['content', 'collab', 'popularity']].to_numpy()
+weights = np.stack([alphas, betas, gammas], axis=1)
+scores = component_scores @ weights.T
+
+results_df = pd.DataFrame({
+    'alpha': alphas,
+    'beta': betas.round(2),
+    'gamma': gammas.round(2),
+    'top_product': example_candidates['product'].to_numpy()[scores.argmax(axis=0)]
+})
 print("\\n⚙️ How Weight Tuning Affects Rankings:")
 display(results_df)
-print("\\n💡 Different weight combinations favor different products!")""")
+print("\\n💡 Different weight combinations favor different products!")"""),
 
-# ============================================================================
-# SECTION 7: Performance Metrics (if data exists)
-# ============================================================================
-add_markdown("""## Section 7: Recommendation Performance Metrics
+    # ============================================================================
+    # SECTION 7: Performance Metrics (if data exists)
+    # ============================================================================
+    ("md", """## Section 7: Recommendation Performance Metrics
 
 **Goal**: Analyze recommendation performance by context
 
@@ -626,9 +591,9 @@ Metrics tracked:
 - Clicks (how many times users clicked)
 - Conversions (how many led to purchases)
 - CTR (Click-through rate)
-- Revenue attribution""")
+- Revenue attribution"""),
 
-add_code("""# Check performance data
+    ("code", """# Check performance data
 perf_count_result = query_db("SELECT COUNT(*) as count FROM recommender.recommendation_performance")
 perf_count = perf_count_result['count'].iloc[0]
 
@@ -663,12 +628,12 @@ else:
         color='ctr',
         color_continuous_scale='blues'
     )
-    fig.show()""")
+    fig.show()"""),
 
-# ============================================================================
-# SECTION 8-11: Placeholder sections
-# ============================================================================
-add_markdown("""## Section 8-11: Additional Analysis
+    # ============================================================================
+    # SECTION 8-11: Placeholder sections
+    # ============================================================================
+    ("md", """## Section 8-11: Additional Analysis
 
 The following sections cover:
 - **Section 8**: Cart Abandonment & Email Campaigns
@@ -682,15 +647,15 @@ To generate data:
 1. Use the API to track interactions: `POST /api/v1/interactions`
 2. Build user preferences: `UserPreferenceService.update_user_preference(user_id)`
 3. Serve recommendations: `GET /api/v1/recommendations/homepage`
-4. Track performance in the `recommendation_performance` table""")
+4. Track performance in the `recommendation_performance` table"""),
 
-add_markdown("""## ✅ EDA Summary
+    ("md", """## ✅ EDA Summary
 
 This notebook provided a comprehensive exploratory analysis of the Reemio recommendation system covering:
 
 1. **Data Connection** - Successfully connected to PostgreSQL with 3000+ products
 2. **Product Catalog** - Analyzed pricing, categories, and stock distribution
-3. **Embeddings** - 384-dimensional vectors with t-SNE visualization
+3. **Embeddings** - 384-dimensional vectors with UMAP visualization
 4. **Hybrid Algorithm** - 4-stage pipeline with content + collaborative filtering
 5. **User Preferences** - Weighted interaction system with recency decay
 
@@ -700,12 +665,45 @@ This notebook provided a comprehensive exploratory analysis of the Reemio recomm
 - Monitor recommendation performance metrics
 - Tune hybrid scoring weights (α, β, γ) based on A/B tests
 
-**System Status**: 🟢 Ready for recommendations""")
+**System Status**: 🟢 Ready for recommendations"""),
+]
+
+NOTEBOOK_METADATA = {
+    "kernelspec": {
+        "display_name": "Python 3",
+        "language": "python",
+        "name": "python3"
+    },
+    "language_info": {
+        "name": "python",
+        "version": "3.13"
+    }
+}
+
+
+def build_cell(kind, source):
+    cell = {
+        "cell_type": "markdown" if kind == "md" else "code",
+        "metadata": {},
+        "source": source.splitlines(keepends=True),
+    }
+    if kind == "code":
+        cell["execution_count"] = None
+        cell["outputs"] = []
+    return cell
+
+
+notebook = {
+    "cells": [build_cell(kind, source) for kind, source in CELLS],
+    "metadata": NOTEBOOK_METADATA,
+    "nbformat": 4,
+    "nbformat_minor": 5
+}
 
 # Save notebook
 output_path = "recommendation_system_eda.ipynb"
-with open(output_path, 'w') as f:
-    json.dump(notebook, f, indent=2)
+with open(output_path, 'wb') as f:
+    f.write(orjson.dumps(notebook))
 
 print(f"✅ Notebook created successfully with {len(notebook['cells'])} cells!")
 print(f"📓 Saved to: {output_path}")
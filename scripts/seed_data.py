@@ -2,223 +2,207 @@
 """
 Seed database with test data for development.
 
+Rows are built as tuples in table column order and written in a single transaction:
+products and users via executemany, interactions via binary COPY in fixed-size chunks.
+
 Usage:
-    python scripts/seed_data.py
+    python scripts/seed_data.py [--interactions N]
 """
 
+import argparse
 import asyncio
 import os
 import sys
-from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from pathlib import Path
+
+import asyncpg
+import numpy as np
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # optional - fall back to the default asyncio loop
+    uvloop = None
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from recommendation_service.config import get_settings
+
+INTERACTION_COLUMNS = (
+    "external_user_id",
+    "external_product_id",
+    "interaction_type",
+    "created_at",
+)
+
+SEED_FILE = Path(__file__).parent / "seeds" / "seed_data.json"
+
+INTERACTION_BATCH_SIZE = 10_000
+
+# Interaction mix for synthetic load-test rows
+SYNTHETIC_INTERACTION_TYPES = np.array(["VIEW", "CART_ADD", "PURCHASE", "WISHLIST_ADD"])
+SYNTHETIC_INTERACTION_WEIGHTS = [0.8, 0.12, 0.05, 0.03]
+SYNTHETIC_WINDOW_DAYS = 30
 
-async def seed_products():
-    """Seed sample products."""
+
+def load_seed_file():
+    """Load the sample products and users from the seed data file."""
+    return orjson.loads(SEED_FILE.read_bytes())
+
+
+async def seed_products(seed=None):
+    """Seed sample products as (external_product_id, name, category, price_cents, stock)."""
+    seed = seed or load_seed_file()
     products = [
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-001",
-            "name": "Wireless Noise-Canceling Headphones",
-            "description": "Premium over-ear headphones with active noise cancellation and 30-hour battery life.",
-            "category": "Electronics",
-            "price": 299.99,
-            "stock_quantity": 50,
-            "image_url": "https://example.com/headphones.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-002",
-            "name": "Mechanical Gaming Keyboard",
-            "description": "RGB backlit mechanical keyboard with Cherry MX switches.",
-            "category": "Electronics",
-            "price": 149.99,
-            "stock_quantity": 100,
-            "image_url": "https://example.com/keyboard.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-003",
-            "name": "Ergonomic Office Chair",
-            "description": "Adjustable lumbar support, breathable mesh, and armrests.",
-            "category": "Furniture",
-            "price": 399.99,
-            "stock_quantity": 25,
-            "image_url": "https://example.com/chair.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-004",
-            "name": "4K Ultra HD Monitor",
-            "description": "27-inch 4K display with HDR support and USB-C connectivity.",
-            "category": "Electronics",
-            "price": 449.99,
-            "stock_quantity": 30,
-            "image_url": "https://example.com/monitor.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-005",
-            "name": "Standing Desk Converter",
-            "description": "Height-adjustable desk converter for existing desks.",
-            "category": "Furniture",
-            "price": 199.99,
-            "stock_quantity": 40,
-            "image_url": "https://example.com/desk.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-006",
-            "name": "Wireless Mouse",
-            "description": "Ergonomic wireless mouse with customizable buttons.",
-            "category": "Electronics",
-            "price": 79.99,
-            "stock_quantity": 150,
-            "image_url": "https://example.com/mouse.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-007",
-            "name": "USB-C Hub",
-            "description": "7-in-1 USB-C hub with HDMI, USB-A, and SD card reader.",
-            "category": "Electronics",
-            "price": 49.99,
-            "stock_quantity": 200,
-            "image_url": "https://example.com/hub.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-008",
-            "name": "Desk Lamp",
-            "description": "LED desk lamp with adjustable brightness and color temperature.",
-            "category": "Furniture",
-            "price": 59.99,
-            "stock_quantity": 75,
-            "image_url": "https://example.com/lamp.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-009",
-            "name": "Webcam HD 1080p",
-            "description": "Full HD webcam with built-in microphone and auto-focus.",
-            "category": "Electronics",
-            "price": 89.99,
-            "stock_quantity": 60,
-            "image_url": "https://example.com/webcam.jpg",
-        },
-        {
-            "id": str(uuid4()),
-            "external_product_id": "prod-010",
-            "name": "Laptop Stand",
-            "description": "Aluminum laptop stand with adjustable height.",
-            "category": "Accessories",
-            "price": 39.99,
-            "stock_quantity": 120,
-            "image_url": "https://example.com/stand.jpg",
-        },
+        (p["external_product_id"], p["name"], p["category"], p["price_cents"], p["stock"])
+        for p in seed["products"]
     ]
 
     print(f"Created {len(products)} sample products")
     return products
 
 
-async def seed_users():
-    """Seed sample users."""
-    users = [
-        {
-            "id": str(uuid4()),
-            "external_user_id": "user-001",
-            "email": "alice@example.com",
-        },
-        {
-            "id": str(uuid4()),
-            "external_user_id": "user-002",
-            "email": "bob@example.com",
-        },
-        {
-            "id": str(uuid4()),
-            "external_user_id": "user-003",
-            "email": "charlie@example.com",
-        },
-    ]
+async def seed_users(seed=None):
+    """Seed sample users as (external_user_id, email)."""
+    seed = seed or load_seed_file()
+    users = [(u["external_user_id"], u["email"]) for u in seed["users"]]
 
     print(f"Created {len(users)} sample users")
     return users
 
 
 async def seed_interactions(users, products):
-    """Seed sample interactions."""
+    """Seed sample interactions as rows in INTERACTION_COLUMNS order."""
     interactions = []
-    now = datetime.now(timezone.utc)
+    now = datetime.now()  # Use naive datetime for DB
 
     # Alice: Interested in electronics, viewed many items, purchased headphones
-    alice = users[0]
+    alice = users[0][0]
     for i, prod in enumerate(products[:5]):
-        interactions.append({
-            "id": str(uuid4()),
-            "user_id": alice["id"],
-            "product_id": prod["id"],
-            "interaction_type": "view",
-            "created_at": now - timedelta(days=i, hours=i * 2),
-        })
-
-    interactions.append({
-        "id": str(uuid4()),
-        "user_id": alice["id"],
-        "product_id": products[0]["id"],  # Headphones
-        "interaction_type": "cart_add",
-        "created_at": now - timedelta(days=1),
-    })
-
-    interactions.append({
-        "id": str(uuid4()),
-        "user_id": alice["id"],
-        "product_id": products[0]["id"],
-        "interaction_type": "purchase",
-        "created_at": now - timedelta(hours=12),
-    })
+        interactions.append((alice, prod[0], "VIEW", now - timedelta(days=i, hours=i * 2)))
+
+    # Headphones
+    interactions.append((alice, products[0][0], "CART_ADD", now - timedelta(days=1)))
+    interactions.append((alice, products[0][0], "PURCHASE", now - timedelta(hours=12)))
 
     # Bob: Browsing furniture, added to cart but abandoned
-    bob = users[1]
+    bob = users[1][0]
     for prod in [products[2], products[4], products[7]]:  # Furniture items
-        interactions.append({
-            "id": str(uuid4()),
-            "user_id": bob["id"],
-            "product_id": prod["id"],
-            "interaction_type": "view",
-            "created_at": now - timedelta(hours=3),
-        })
-
-    interactions.append({
-        "id": str(uuid4()),
-        "user_id": bob["id"],
-        "product_id": products[2]["id"],  # Office chair
-        "interaction_type": "cart_add",
-        "created_at": now - timedelta(hours=2, minutes=30),
-    })
+        interactions.append((bob, prod[0], "VIEW", now - timedelta(hours=3)))
+
+    # Office chair
+    interactions.append(
+        (bob, products[2][0], "CART_ADD", now - timedelta(hours=2, minutes=30))
+    )
 
     print(f"Created {len(interactions)} sample interactions")
     return interactions
 
 
-async def main():
+def generate_interactions(users, products, count, now, seed=42):
+    """Generate `count` random interactions as an iterator of rows.
+
+    Each column is drawn as one numpy array instead of per-row Python arithmetic;
+    rows are only zipped into tuples as COPY consumes them.
+    """
+    rng = np.random.default_rng(seed)
+    user_ids = np.array([u[0] for u in users])
+    product_ids = np.array([p[0] for p in products])
+
+    offsets = rng.integers(0, SYNTHETIC_WINDOW_DAYS * 86_400, size=count)
+    created_at = np.datetime64(now, "us") - offsets.astype("timedelta64[s]")
+
+    return zip(
+        rng.choice(user_ids, size=count).tolist(),
+        rng.choice(product_ids, size=count).tolist(),
+        rng.choice(
+            SYNTHETIC_INTERACTION_TYPES, size=count, p=SYNTHETIC_INTERACTION_WEIGHTS
+        ).tolist(),
+        created_at.tolist(),
+        strict=True,
+    )
+
+
+async def insert_seed_data(conn, products, users, interactions):
+    """Write all seed rows in one transaction."""
+    async with conn.transaction():
+        await conn.executemany(
+            """
+            INSERT INTO recommender.product_embeddings
+            (external_product_id, name, category, price_cents, stock, is_active, popularity_score)
+            VALUES ($1, $2, $3, $4, $5, true, 0.0)
+            ON CONFLICT (external_product_id) DO NOTHING
+            """,
+            products,
+        )
+
+        # Users only exist in the recommender schema through their email preferences
+        await conn.executemany(
+            """
+            INSERT INTO recommender.user_email_preferences
+            (external_user_id, cart_abandonment_enabled, new_products_enabled,
+             weekly_digest_enabled, personalized_picks_enabled, back_in_stock_enabled,
+             frequency_cap_per_week)
+            VALUES ($1, true, true, true, true, true, 3)
+            ON CONFLICT (external_user_id) DO NOTHING
+            """,
+            [user[:1] for user in users],
+        )
+
+        rows = iter(interactions)
+        while batch := list(islice(rows, INTERACTION_BATCH_SIZE)):
+            await conn.copy_records_to_table(
+                "user_interactions",
+                schema_name="recommender",
+                columns=INTERACTION_COLUMNS,
+                records=batch,
+            )
+
+
+async def main(synthetic_interactions: int = 0):
     """Run seeding."""
     print("Seeding database with test data...")
     print("=" * 50)
 
-    products = await seed_products()
-    users = await seed_users()
+    seed = load_seed_file()
+    products = await seed_products(seed)
+    users = await seed_users(seed)
     interactions = await seed_interactions(users, products)
+    if synthetic_interactions:
+        interactions = chain(
+            interactions,
+            generate_interactions(users, products, synthetic_interactions, datetime.now()),
+        )
+        print(f"Generating {synthetic_interactions} synthetic interactions")
+
+    settings = get_settings()
+    conn = await asyncpg.connect(
+        host=settings.postgres_host,
+        port=settings.postgres_port,
+        user=settings.postgres_user,
+        password=settings.postgres_password,
+        database=settings.postgres_db,
+    )
+    try:
+        await insert_seed_data(conn, products, users, interactions)
+    finally:
+        await conn.close()
 
     print("=" * 50)
     print("Seeding complete!")
-    print("")
-    print("Note: This script creates sample data structures.")
-    print("To actually insert into the database, implement the database connection.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Seed database with test data")
+    parser.add_argument(
+        "--interactions",
+        type=int,
+        default=0,
+        help="Additional random interactions to generate for load testing",
+    )
+    args = parser.parse_args()
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main(args.interactions))
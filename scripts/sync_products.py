@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """CLI script to sync products from e-commerce to recommender schema and generate embeddings."""
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -9,35 +10,86 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from recommendation_service.infrastructure.database.connection import get_db_session
+try:
+    import uvloop
+except ImportError:  # optional - fall back to the default asyncio loop
+    uvloop = None
+
+from recommendation_service.config import get_settings
 from recommendation_service.services.embedding import EmbeddingService
 from recommendation_service.services.product_sync import ProductSyncService
 
 logger = structlog.get_logger()
 
+# One engine spans both phases so embedding generation reuses the connections the
+# product sync already opened
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 40
+POOL_RECYCLE_SECONDS = 300
+
+
+async def warm_pool(engine, size: int) -> None:
+    """Open `size` pooled connections up front instead of on first use."""
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
-async def main():
+    await asyncio.gather(*(ping() for _ in range(size)))
+
+
+async def main(batch_size: int, concurrency: int):
     """Main sync function."""
     logger.info("Starting product sync")
 
-    async with get_db_session() as session:
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.database_url,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+    )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        await warm_pool(engine, POOL_SIZE)
+
         # Sync products
-        sync_service = ProductSyncService(session)
-        logger.info("Syncing products from e-commerce database")
-        sync_result = await sync_service.sync_all_products(batch_size=100)
-        logger.info("Product sync completed", **sync_result)
+        async with session_factory() as session:
+            sync_service = ProductSyncService(session)
+            logger.info("Syncing products from e-commerce database")
+            sync_result = await sync_service.sync_all_products(batch_size=100)
+            logger.info("Product sync completed", **sync_result)
 
         # Generate embeddings
-        embedding_service = EmbeddingService(session)
-        logger.info("Generating embeddings for products")
-        embedding_result = await embedding_service.update_product_embeddings(
-            batch_size=50, only_missing=True
-        )
-        logger.info("Embedding generation completed", **embedding_result)
+        async with session_factory() as session:
+            embedding_service = EmbeddingService(session)
+            logger.info("Generating embeddings for products")
+            embedding_result = await embedding_service.update_product_embeddings(
+                batch_size=batch_size,
+                only_missing=True,
+                concurrency=concurrency,
+                session_factory=session_factory,
+            )
+            logger.info("Embedding generation completed", **embedding_result)
+    finally:
+        await engine.dispose()
 
     logger.info("All operations completed successfully")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size", type=int, default=32, help="Products embedded and written per batch"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=2, help="Embedding batch writes in flight at once"
+    )
+    args = parser.parse_args()
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main(args.batch_size, args.concurrency))
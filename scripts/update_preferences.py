@@ -5,6 +5,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # optional - fall back to the default asyncio loop
+    uvloop = None
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -40,4 +45,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main())
@@ -1,5 +1,7 @@
 """Celery application for email worker."""
 
+import orjson
+import structlog
 from celery import Celery
 from celery.schedules import crontab
 
@@ -7,6 +9,27 @@ from recommendation_service.config import get_settings
 
 settings = get_settings()
 
+# Level filtering turns disabled log calls into no-ops, and in production records
+# are rendered straight to bytes by orjson without an intermediate str
+structlog.configure(
+    processors=[
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.dev.set_exc_info,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.dev.ConsoleRenderer()
+        if settings.debug
+        else structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
+    context_class=dict,
+    logger_factory=structlog.PrintLoggerFactory()
+    if settings.debug
+    else structlog.BytesLoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+
 # Create Celery app
 app = Celery(
     "email_worker",
@@ -18,6 +41,7 @@ app = Celery(
         "email_worker.tasks.weekly_digest",
         "email_worker.tasks.personalized_picks",
         "email_worker.tasks.back_in_stock",
+        "email_worker.tasks.orchestrator",
     ],
 )
 
@@ -26,42 +50,34 @@ app.conf.update(
     task_serializer="json",
     accept_content=["json"],
     result_serializer="json",
+    # Compress task and result bodies on the broker (user id slices, rendered emails)
+    task_compression="gzip",
+    result_compression="gzip",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=300,  # 5 minutes
     task_soft_time_limit=240,  # 4 minutes
-    worker_prefetch_multiplier=1,
-    task_acks_late=True,
-    task_reject_on_worker_lost=True,
+    # Sends wait on the network, not the CPU: run them on a thread pool and let each
+    # worker reserve several messages so threads are never idle between round-trips
+    worker_pool="threads",
+    worker_concurrency=32,
+    worker_prefetch_multiplier=8,
+    # Tasks ack on receipt by default; the few whose loss would skip a whole
+    # campaign cycle opt back into acks_late on their decorators
     task_default_queue="email",
     task_routes={
         "email_worker.tasks.*": {"queue": "email"},
     },
 )
 
-# Beat schedule for periodic tasks
+# Beat schedule for periodic tasks. Campaign cadences live in
+# email_worker.tasks.orchestrator; one scan of active users feeds every due campaign.
 app.conf.beat_schedule = {
-    # Check for abandoned carts every 15 minutes
-    "check-abandoned-carts": {
-        "task": "email_worker.tasks.cart_abandonment.check_abandoned_carts",
+    "scan-and-dispatch": {
+        "task": "email_worker.tasks.orchestrator.scan_and_dispatch",
         "schedule": crontab(minute="*/15"),
     },
-    # Send weekly digest on Sundays at 10 AM
-    "send-weekly-digest": {
-        "task": "email_worker.tasks.weekly_digest.send_weekly_digest_batch",
-        "schedule": crontab(hour=10, minute=0, day_of_week=0),
-    },
-    # Check for new products daily at 10 AM
-    "check-new-products": {
-        "task": "email_worker.tasks.new_products.send_new_products_alerts",
-        "schedule": crontab(hour=10, minute=0),
-    },
-    # Check for personalized picks opportunities every 6 hours
-    "check-personalized-picks": {
-        "task": "email_worker.tasks.personalized_picks.check_personalized_picks_opportunities",
-        "schedule": crontab(minute=0, hour="*/6"),
-    },
 }
 
 
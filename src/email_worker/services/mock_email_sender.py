@@ -1,13 +1,18 @@
 """Mock email sender for testing and development."""
 
-import json
-import os
-import structlog
+import asyncio
+import threading
+from collections import defaultdict, deque
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+import orjson
+import structlog
+
 logger = structlog.get_logger()
 
 
@@ -18,19 +23,42 @@ class MockEmailSender:
     Stores sent emails to filesystem for inspection instead of
     actually sending them. In production, replace with SendGrid,
     AWS SES, or another email provider.
+
+    Emails are appended as JSON lines to a single log file in the
+    storage directory rather than written one file per email.
     """
 
-    def __init__(self, storage_path: str | None = None):
+    LOG_FILENAME = "sent_emails.jsonl"
+
+    def __init__(
+        self,
+        storage_path: str | None = None,
+        max_in_memory: int = 10_000,
+        max_per_recipient: int = 1_000,
+    ):
         """
         Initialize the mock email sender.
 
         Args:
             storage_path: Directory to store mock emails.
                          Defaults to /tmp/reemio_mock_emails
+            max_in_memory: Most recent emails kept in memory; older ones
+                          remain available on the filesystem
+            max_per_recipient: Most recent emails kept per recipient
         """
+        # Created on first write, so constructing a sender touches no filesystem
         self.storage_path = Path(storage_path or "/tmp/reemio_mock_emails")
-        self.storage_path.mkdir(parents=True, exist_ok=True)
-        self.sent_emails: list[dict[str, Any]] = []
+        self.sent_emails: deque[dict[str, Any]] = deque(maxlen=max_in_memory)
+        self._by_recipient: defaultdict[str, deque[dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=max_per_recipient)
+        )
+        self.log_path = self.storage_path / self.LOG_FILENAME
+        # Guards the log file and the incremental read state below; the email
+        # worker runs tasks on a thread pool that shares this sender
+        self._log_lock = threading.Lock()
+        # Byte offset read so far and the emails parsed from the log up to it
+        self._stored_offset = 0
+        self._stored_emails: list[dict[str, Any]] = []
 
     async def send_email(
         self,
@@ -77,29 +105,37 @@ class MockEmailSender:
 
         # Store in memory
         self.sent_emails.append(email_record)
+        self._by_recipient[to_email].append(email_record)
 
-        # Store to filesystem
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{message_id}.json"
-        filepath = self.storage_path / filename
-
-        with open(filepath, "w") as f:
-            json.dump(email_record, f, indent=2)
+        # Append to the log off the event loop so a slow disk doesn't stall other sends
+        await asyncio.to_thread(self._append_to_log, orjson.dumps(email_record) + b"\n")
 
         logger.info(
             "Mock email sent",
             message_id=message_id,
             to_email=to_email,
             subject=subject,
-            stored_at=str(filepath),
+            stored_at=str(self.log_path),
         )
 
         return {
             "success": True,
             "message_id": message_id,
             "status": "sent",
-            "stored_at": str(filepath),
+            "stored_at": str(self.log_path),
         }
 
+    def _append_to_log(self, line: bytes) -> None:
+        """Append one encoded email to the log.
+
+        The file is opened per append so no handle outlives the call; at mock
+        volumes that costs far less than the send it records.
+        """
+        with self._log_lock:
+            self.storage_path.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "ab") as f:
+                f.write(line)
+
     def get_sent_emails(
         self,
         limit: int = 50,
@@ -115,27 +151,45 @@ class MockEmailSender:
         Returns:
             list: List of sent email records
         """
-        emails = self.sent_emails
-
-        if to_email:
-            emails = [e for e in emails if e["to_email"] == to_email]
+        emails = self._by_recipient.get(to_email, ()) if to_email else self.sent_emails
 
-        return emails[-limit:]
+        # Walk back from the newest entry so only `limit` records are touched
+        recent = list(islice(reversed(emails), limit))
+        recent.reverse()
+        return recent
 
     def get_all_stored_emails(self) -> list[dict[str, Any]]:
         """
         Retrieve all emails stored on filesystem.
 
+        The log is append-only, so only the bytes written since the
+        previous call are read and parsed.
+
         Returns:
             list: List of all stored email records
         """
-        emails = []
-
-        for filepath in sorted(self.storage_path.glob("*.json")):
-            with open(filepath) as f:
-                emails.append(json.load(f))
-
-        return emails
+        with self._log_lock:
+            try:
+                size = self.log_path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size < self._stored_offset:
+                # Log was truncated or replaced; start over
+                self._stored_offset = 0
+                self._stored_emails = []
+
+            if size > self._stored_offset:
+                with open(self.log_path, "rb") as f:
+                    f.seek(self._stored_offset)
+                    chunk = f.read(size - self._stored_offset)
+                # Only consume complete lines; a partial trailing write is picked up next time
+                end = chunk.rfind(b"\n") + 1
+                self._stored_emails.extend(
+                    orjson.loads(line) for line in chunk[:end].splitlines()
+                )
+                self._stored_offset += end
+
+            return list(self._stored_emails)
 
     def clear_stored_emails(self) -> int:
         """
@@ -144,24 +198,28 @@ class MockEmailSender:
         Returns:
             int: Number of emails deleted
         """
-        count = 0
-        for filepath in self.storage_path.glob("*.json"):
-            filepath.unlink()
-            count += 1
-
-        self.sent_emails.clear()
+        with self._log_lock:
+            try:
+                with open(self.log_path, "rb") as f:
+                    count = sum(1 for _ in f)
+                self.log_path.unlink()
+            except FileNotFoundError:
+                count = 0
+
+            self.sent_emails.clear()
+            self._by_recipient.clear()
+            self._stored_offset = 0
+            self._stored_emails = []
         logger.info("Cleared mock emails", count=count)
 
         return count
 
 
-# Singleton instance for the application
-_mock_sender: MockEmailSender | None = None
-
-
+@lru_cache(maxsize=1)
 def get_mock_email_sender() -> MockEmailSender:
-    """Get the singleton mock email sender instance."""
-    global _mock_sender
-    if _mock_sender is None:
-        _mock_sender = MockEmailSender()
-    return _mock_sender
+    """Get the singleton mock email sender instance.
+
+    Each Celery worker process builds its own sender on first use; threads
+    within a process share it.
+    """
+    return MockEmailSender()
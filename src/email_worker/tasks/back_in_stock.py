@@ -3,7 +3,7 @@
 import structlog
 from celery import shared_task
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="email_worker")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -20,7 +20,8 @@ def notify_back_in_stock(self, product_id: str) -> dict:
     Returns:
         dict: Summary of notifications sent
     """
-    logger.info("Processing back in stock notification", product_id=product_id)
+    log = logger.bind(task_id=self.request.id, product_id=product_id)
+    log.info("Processing back in stock notification")
 
     # TODO: Implement actual logic
     # 1. Find users who viewed/wishlisted this product when it was OOS
@@ -3,11 +3,11 @@
 import structlog
 from celery import shared_task
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="email_worker")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def check_abandoned_carts(self) -> dict:
+def check_abandoned_carts(self, user_ids: list[str] | None = None) -> dict:
     """
     Check for abandoned carts and queue reminder emails.
 
@@ -16,13 +16,20 @@ def check_abandoned_carts(self) -> dict:
     2. Check if they haven't received a reminder recently
     3. Queue personalized reminder emails
 
+    Args:
+        user_ids: Active users preloaded by the orchestrator scan
+
     Returns:
         dict: Summary of processed carts
     """
-    logger.info("Checking for abandoned carts")
+    user_ids = user_ids or []
+    log = logger.bind(task_id=self.request.id)
+    log.info("Checking for abandoned carts", candidates=len(user_ids))
 
     # TODO: Implement actual logic
-    # 1. Query cart_abandonment table for pending reminders
+    # 1. Query cart_abandonment table for pending reminders of user_ids
+    #    (reminder_sent_at IS NULL AND recovered = false matches the
+    #    ix_ca_pending_reminders partial index)
     # 2. For each abandoned cart:
     #    - Generate personalized recommendations
     #    - Create email campaign record
@@ -30,13 +37,14 @@ def check_abandoned_carts(self) -> dict:
     #    - Update reminder_sent_at
 
     return {
+        "candidates": len(user_ids),
         "processed": 0,
         "emails_queued": 0,
         "skipped": 0,
     }
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True)
 def send_cart_abandonment_email(self, user_id: str, cart_abandonment_id: str) -> dict:
     """
     Send a cart abandonment reminder email to a specific user.
@@ -48,11 +56,12 @@ def send_cart_abandonment_email(self, user_id: str, cart_abandonment_id: str) ->
     Returns:
         dict: Email sending result
     """
-    logger.info(
-        "Sending cart abandonment email",
+    log = logger.bind(
+        task_id=self.request.id,
         user_id=user_id,
         cart_abandonment_id=cart_abandonment_id,
     )
+    log.info("Sending cart abandonment email")
 
     # TODO: Implement actual email sending
     # 1. Fetch user and cart details
@@ -3,11 +3,17 @@
 import structlog
 from celery import shared_task
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="email_worker")
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def send_new_products_alerts(self) -> dict:
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def send_new_products_alerts(self, user_ids: list[str] | None = None) -> dict:
     """
     Send new product alerts to users based on their interests.
 
@@ -16,14 +22,20 @@ def send_new_products_alerts(self) -> dict:
     2. Match new products to user preferences
     3. Send personalized new product alerts
 
+    Args:
+        user_ids: Active users preloaded by the orchestrator scan
+
     Returns:
         dict: Summary of sent alerts
     """
-    logger.info("Checking for new products to alert users about")
+    user_ids = user_ids or []
+    log = logger.bind(task_id=self.request.id)
+    log.info("Checking for new products to alert users about", candidates=len(user_ids))
 
-    # TODO: Implement actual logic
+    # TODO: Implement actual logic, matching new products against user_ids only
 
     return {
+        "candidates": len(user_ids),
         "new_products_count": 0,
         "users_notified": 0,
         "emails_sent": 0,
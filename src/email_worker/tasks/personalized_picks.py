@@ -3,11 +3,11 @@
 import structlog
 from celery import shared_task
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="email_worker")
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def check_personalized_picks_opportunities(self) -> dict:
+def check_personalized_picks_opportunities(self, user_ids: list[str] | None = None) -> dict:
     """
     Check for users who might benefit from personalized pick emails.
 
@@ -16,15 +16,20 @@ def check_personalized_picks_opportunities(self) -> dict:
     - User hasn't added anything to cart
     - User hasn't received this email type in 7 days
 
+    Args:
+        user_ids: Active users preloaded by the orchestrator scan
+
     Returns:
         dict: Summary of opportunities found
     """
-    logger.info("Checking for personalized picks opportunities")
+    user_ids = user_ids or []
+    log = logger.bind(task_id=self.request.id)
+    log.info("Checking for personalized picks opportunities", candidates=len(user_ids))
 
-    # TODO: Implement actual logic
+    # TODO: Implement actual logic over user_ids, which already meet the view threshold
 
     return {
-        "users_checked": 0,
+        "users_checked": len(user_ids),
         "opportunities_found": 0,
         "emails_queued": 0,
     }
@@ -3,11 +3,15 @@
 import structlog
 from celery import shared_task
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="email_worker")
 
+DIGEST_CHUNK_SIZE = 100
 
+
+# Acked on receipt: redelivering a batch after its fan-out would send every
+# recipient the digest twice. Late acks are on the per-user sends instead.
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def send_weekly_digest_batch(self) -> dict:
+def send_weekly_digest_batch(self, user_ids: list[str] | None = None) -> dict:
     """
     Send weekly digest emails to all eligible users.
 
@@ -16,21 +20,39 @@ def send_weekly_digest_batch(self) -> dict:
     2. Generate personalized recommendations for each
     3. Send digest emails in batches
 
+    Args:
+        user_ids: Active users preloaded by the orchestrator scan
+
     Returns:
         dict: Summary of sent emails
     """
-    logger.info("Starting weekly digest batch")
+    log = logger.bind(task_id=self.request.id)
+    log.info("Starting weekly digest batch")
 
     # TODO: Implement actual logic
 
+    user_ids = user_ids or []
+    if user_ids:
+        # One broker message per DIGEST_CHUNK_SIZE recipients instead of one per user
+        send_weekly_digest_email.chunks(
+            ((user_id,) for user_id in user_ids), DIGEST_CHUNK_SIZE
+        ).apply_async()
+
     return {
-        "total_users": 0,
+        "total_users": len(user_ids),
         "emails_sent": 0,
         "errors": 0,
     }
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    ignore_result=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
 def send_weekly_digest_email(self, user_id: str) -> dict:
     """
     Send weekly digest email to a specific user.
@@ -41,7 +63,8 @@ def send_weekly_digest_email(self, user_id: str) -> dict:
     Returns:
         dict: Email sending result
     """
-    logger.info("Sending weekly digest", user_id=user_id)
+    log = logger.bind(task_id=self.request.id, user_id=user_id)
+    log.info("Sending weekly digest")
 
     # TODO: Implement actual email sending
 
@@ -3,8 +3,13 @@
 from datetime import date, datetime, timezone
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from recommendation_service.infrastructure.database.connection import get_session
+from recommendation_service.infrastructure.redis import CacheService, get_cache
+from recommendation_service.services.analytics import AnalyticsService
 
 router = APIRouter()
 
@@ -30,8 +35,8 @@ class ProductAnalyticsResponse(BaseModel):
     """Response for product analytics endpoints."""
 
     products: list[ProductMetric]
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
     total_count: int
 
 
@@ -56,8 +61,8 @@ class RecommendationPerformanceResponse(BaseModel):
     overall_conversion_rate_percent: float
     revenue_attributed: float
     by_context: list[RecommendationPerformanceMetric]
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
 
 
 class ConversionFunnelResponse(BaseModel):
@@ -70,8 +75,8 @@ class ConversionFunnelResponse(BaseModel):
     view_to_cart_percent: float
     cart_to_purchase_percent: float
     view_to_purchase_percent: float
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
 
 
 class CategoryPerformance(BaseModel):
@@ -111,6 +116,8 @@ async def get_top_viewed_products(
     end_date: Annotated[date | None, Query(description="End date for analysis")] = None,
     category: Annotated[str | None, Query(description="Filter by category")] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> ProductAnalyticsResponse:
     """
     Get most viewed products within a date range.
@@ -127,17 +134,20 @@ async def get_top_viewed_products(
     - `stable`: Within 20% variation
     - `new`: No data in previous period
     """
-    # TODO: Implement actual analytics query
-
     today = date.today()
     actual_start = start_date or today.replace(day=1)
     actual_end = end_date or today
 
+    analytics = AnalyticsService(session, cache)
+    result = await analytics.get_top_products(
+        "VIEW", actual_start, actual_end, limit=limit, category=category
+    )
+
     return ProductAnalyticsResponse(
-        products=[],
-        start_date=actual_start.isoformat(),
-        end_date=actual_end.isoformat(),
-        total_count=0,
+        products=[ProductMetric(**p) for p in result["products"]],
+        start_date=actual_start,
+        end_date=actual_end,
+        total_count=result["total_count"],
     )
 
 
@@ -150,6 +160,8 @@ async def get_top_recommended_products(
         Query(description="Filter by recommendation context (homepage, product_page, cart, email)"),
     ] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> ProductAnalyticsResponse:
     """
     Get most recommended products within a date range.
@@ -165,17 +177,20 @@ async def get_top_recommended_products(
     - `cart`: Cart-based recommendations
     - `email`: Email campaign recommendations
     """
-    # TODO: Implement actual analytics query
-
     today = date.today()
     actual_start = start_date or today.replace(day=1)
     actual_end = end_date or today
 
+    analytics = AnalyticsService(session, cache)
+    result = await analytics.get_top_products(
+        "RECOMMENDATION_VIEW", actual_start, actual_end, limit=limit, context=context
+    )
+
     return ProductAnalyticsResponse(
-        products=[],
-        start_date=actual_start.isoformat(),
-        end_date=actual_end.isoformat(),
-        total_count=0,
+        products=[ProductMetric(**p) for p in result["products"]],
+        start_date=actual_start,
+        end_date=actual_end,
+        total_count=result["total_count"],
     )
 
 
@@ -185,6 +200,8 @@ async def get_top_purchased_products(
     end_date: Annotated[date | None, Query(description="End date for analysis")] = None,
     category: Annotated[str | None, Query(description="Filter by category")] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> ProductAnalyticsResponse:
     """
     Get best-selling products within a date range.
@@ -194,17 +211,20 @@ async def get_top_purchased_products(
     - Recognize successful products for marketing
     - Track seasonal purchasing patterns
     """
-    # TODO: Implement actual analytics query
-
     today = date.today()
     actual_start = start_date or today.replace(day=1)
     actual_end = end_date or today
 
+    analytics = AnalyticsService(session, cache)
+    result = await analytics.get_top_products(
+        "PURCHASE", actual_start, actual_end, limit=limit, category=category
+    )
+
     return ProductAnalyticsResponse(
-        products=[],
-        start_date=actual_start.isoformat(),
-        end_date=actual_end.isoformat(),
-        total_count=0,
+        products=[ProductMetric(**p) for p in result["products"]],
+        start_date=actual_start,
+        end_date=actual_end,
+        total_count=result["total_count"],
     )
 
 
@@ -238,8 +258,8 @@ async def get_recommendation_performance(
         overall_conversion_rate_percent=0.0,
         revenue_attributed=0.0,
         by_context=[],
-        start_date=start_date.isoformat(),
-        end_date=end_date.isoformat(),
+        start_date=start_date,
+        end_date=end_date,
     )
 
 
@@ -247,6 +267,8 @@ async def get_recommendation_performance(
 async def get_conversion_funnel(
     start_date: Annotated[date, Query(description="Start date for analysis")],
     end_date: Annotated[date, Query(description="End date for analysis")],
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> ConversionFunnelResponse:
     """
     Get conversion funnel analytics.
@@ -261,18 +283,13 @@ async def get_conversion_funnel(
     - Measure impact of recommendations on conversion
     - Set benchmarks for optimization efforts
     """
-    # TODO: Implement actual analytics query
+    analytics = AnalyticsService(session, cache)
+    funnel = await analytics.get_conversion_funnel(start_date, end_date)
 
     return ConversionFunnelResponse(
-        total_users=0,
-        viewed=0,
-        added_to_cart=0,
-        purchased=0,
-        view_to_cart_percent=0.0,
-        cart_to_purchase_percent=0.0,
-        view_to_purchase_percent=0.0,
-        start_date=start_date.isoformat(),
-        end_date=end_date.isoformat(),
+        **funnel,
+        start_date=start_date,
+        end_date=end_date,
     )
 
 
@@ -280,6 +297,8 @@ async def get_conversion_funnel(
 async def get_category_performance(
     start_date: Annotated[date | None, Query(description="Start date for analysis")] = None,
     end_date: Annotated[date | None, Query(description="End date for analysis")] = None,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> dict:
     """
     Get performance metrics by product category.
@@ -289,16 +308,17 @@ async def get_category_performance(
     - Discover underperforming categories needing attention
     - Inform category-level marketing strategies
     """
-    # TODO: Implement actual analytics query
-
     today = date.today()
     actual_start = start_date or today.replace(day=1)
     actual_end = end_date or today
 
+    analytics = AnalyticsService(session, cache)
+    categories = await analytics.get_category_performance(actual_start, actual_end)
+
     return {
-        "categories": [],
-        "start_date": actual_start.isoformat(),
-        "end_date": actual_end.isoformat(),
+        "categories": [CategoryPerformance(**c) for c in categories],
+        "start_date": actual_start,
+        "end_date": actual_end,
     }
 
 
@@ -373,6 +393,6 @@ async def get_email_campaign_performance(
             "overall_open_rate": 0.0,
             "overall_click_rate": 0.0,
         },
-        "start_date": actual_start.isoformat(),
-        "end_date": actual_end.isoformat(),
+        "start_date": actual_start,
+        "end_date": actual_end,
     }
@@ -1,5 +1,6 @@
 """Benchmark and resource profiling endpoints."""
 
+import asyncio
 import platform
 import sys
 from datetime import datetime, timezone
@@ -12,12 +13,40 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from recommendation_service.infrastructure.database.connection import get_session
-from recommendation_service.infrastructure.redis import CacheService, get_redis_client
+from recommendation_service.infrastructure.redis import CacheService, get_cache
 from recommendation_service.middleware.timing import get_endpoint_stats, reset_endpoint_stats
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+CPU_SAMPLE_INTERVAL_SECONDS = 1.0
+
+# Static for the life of the process
+_process = psutil.Process()
+_python_version = sys.version.split()[0]
+_platform = platform.platform()
+
+_last_cpu_percent: float = 0.0
+
+
+async def _sample_cpu(interval: float) -> None:
+    global _last_cpu_percent
+    # The first non-blocking call only primes psutil's counters and returns 0.0
+    _process.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(interval)
+        _last_cpu_percent = _process.cpu_percent(interval=None)
+
+
+def start_cpu_sampler(interval: float = CPU_SAMPLE_INTERVAL_SECONDS) -> asyncio.Task:
+    """Start sampling process CPU usage in the background.
+
+    psutil's non-blocking cpu_percent() measures the delta since its previous
+    call, so sampling on a timer keeps the profile endpoint from sleeping on
+    the event loop. Cancel the returned task on shutdown.
+    """
+    return asyncio.create_task(_sample_cpu(interval))
+
 
 class BenchmarkResponse(BaseModel):
     """Full system resource and performance profile."""
@@ -26,12 +55,13 @@ class BenchmarkResponse(BaseModel):
     system_resources: dict[str, Any]
     database_pool: dict[str, Any]
     cache_status: dict[str, Any]
-    generated_at: str
+    generated_at: datetime
 
 
-@router.get("/profile", response_model=BenchmarkResponse)
+@router.get("/profile", response_model=None, responses={200: {"model": BenchmarkResponse}})
 async def get_benchmark_profile(
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> BenchmarkResponse:
     """
     Get full resource and performance profile.
@@ -40,14 +70,17 @@ async def get_benchmark_profile(
     (CPU, memory, threads), database pool stats, and cache health.
     """
     # System resources
-    process = psutil.Process()
+    # oneshot() lets memory_info() and num_threads() share a single /proc read
+    with _process.oneshot():
+        memory_info = _process.memory_info()
+        num_threads = _process.num_threads()
     system_resources = {
-        "cpu_percent": process.cpu_percent(interval=0.1),
-        "memory_rss_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-        "memory_vms_mb": round(process.memory_info().vms / 1024 / 1024, 2),
-        "threads": process.num_threads(),
-        "python_version": sys.version.split()[0],
-        "platform": platform.platform(),
+        "cpu_percent": _last_cpu_percent,
+        "memory_rss_mb": round(memory_info.rss / 1024 / 1024, 2),
+        "memory_vms_mb": round(memory_info.vms / 1024 / 1024, 2),
+        "threads": num_threads,
+        "python_version": _python_version,
+        "platform": _platform,
     }
 
     # Database pool stats
@@ -61,20 +94,18 @@ async def get_benchmark_profile(
         db_pool_stats[attr] = val() if callable(val) else "N/A"
 
     # Cache status
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
     cache_healthy = await cache.health_check()
     cache_status = {
         "connected": cache_healthy,
         "type": "redis" if cache_healthy else "none",
     }
 
-    return BenchmarkResponse(
+    return BenchmarkResponse.model_construct(
         endpoint_latencies=get_endpoint_stats(),
         system_resources=system_resources,
         database_pool=db_pool_stats,
         cache_status=cache_status,
-        generated_at=datetime.now(timezone.utc).isoformat(),
+        generated_at=datetime.now(timezone.utc),
     )
 
 
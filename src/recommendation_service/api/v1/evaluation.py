@@ -1,5 +1,6 @@
 """Evaluation API endpoints for recommendation system metrics."""
 
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
@@ -29,7 +30,7 @@ class MetricsResponse(BaseModel):
 class ComparisonResponse(BaseModel):
     comparison: dict
     best_strategy: str
-    evaluated_at: str
+    evaluated_at: datetime
 
 
 class CoverageResponse(BaseModel):
@@ -44,7 +45,7 @@ class EngagementResponse(BaseModel):
     total_users: int
 
 
-@router.get("/metrics", response_model=MetricsResponse)
+@router.get("/metrics", response_model=None, responses={200: {"model": MetricsResponse}})
 async def get_evaluation_metrics(
     k: Annotated[int, Query(ge=1, le=50, description="Number of recommendations to evaluate")] = 10,
     test_days: Annotated[int, Query(ge=1, le=30, description="Days to use as test period")] = 7,
@@ -65,10 +66,10 @@ async def get_evaluation_metrics(
     """
     evaluator = RecommendationEvaluator(session)
     metrics = await evaluator.evaluate(k=k, test_days=test_days)
-    return MetricsResponse(**metrics.to_dict())
+    return MetricsResponse.model_construct(**metrics.to_dict())
 
 
-@router.get("/compare", response_model=ComparisonResponse)
+@router.get("/compare", response_model=None, responses={200: {"model": ComparisonResponse}})
 async def compare_strategies(
     k: Annotated[int, Query(ge=1, le=50)] = 10,
     session: AsyncSession = Depends(get_session),
@@ -85,10 +86,10 @@ async def compare_strategies(
     """
     evaluator = RecommendationEvaluator(session)
     comparison = await evaluator.compare_strategies(k=k)
-    return ComparisonResponse(**comparison)
+    return ComparisonResponse.model_construct(**comparison)
 
 
-@router.get("/coverage", response_model=CoverageResponse)
+@router.get("/coverage", response_model=None, responses={200: {"model": CoverageResponse}})
 async def get_coverage_report(
     session: AsyncSession = Depends(get_session),
 ) -> CoverageResponse:
@@ -100,10 +101,10 @@ async def get_coverage_report(
     """
     evaluator = RecommendationEvaluator(session)
     report = await evaluator.get_coverage_report()
-    return CoverageResponse(**report)
+    return CoverageResponse.model_construct(**report)
 
 
-@router.get("/engagement", response_model=EngagementResponse)
+@router.get("/engagement", response_model=None, responses={200: {"model": EngagementResponse}})
 async def get_engagement_stats(
     session: AsyncSession = Depends(get_session),
 ) -> EngagementResponse:
@@ -115,4 +116,4 @@ async def get_engagement_stats(
     """
     evaluator = RecommendationEvaluator(session)
     stats = await evaluator.get_user_engagement_stats()
-    return EngagementResponse(**stats)
+    return EngagementResponse.model_construct(**stats)
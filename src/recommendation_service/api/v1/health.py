@@ -11,6 +11,14 @@ from recommendation_service.config import get_settings
 
 router = APIRouter()
 
+# Settings are fixed for the life of the process, so /health only stamps the time
+_ENVIRONMENT = get_settings().app_env
+_DEPENDENCIES: dict[str, Any] = {
+    "postgres": "configured",
+    "pgvector": "configured",
+    "redis": "configured",
+}
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -29,7 +37,7 @@ class ReadinessResponse(BaseModel):
     checks: dict[str, bool]
 
 
-@router.get("/health", response_model=HealthResponse)
+@router.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
 async def health_check() -> HealthResponse:
     """
     Basic health check endpoint.
@@ -38,22 +46,16 @@ async def health_check() -> HealthResponse:
     This endpoint is used by load balancers and orchestrators
     to determine if the service is running.
     """
-    settings = get_settings()
-
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         version=__version__,
-        environment=settings.app_env,
+        environment=_ENVIRONMENT,
         timestamp=datetime.now(timezone.utc).isoformat(),
-        dependencies={
-            "postgres": "configured",
-            "pgvector": "configured",
-            "redis": "configured",
-        },
+        dependencies=_DEPENDENCIES,
     )
 
 
-@router.get("/health/ready", response_model=ReadinessResponse)
+@router.get("/health/ready", response_model=None, responses={200: {"model": ReadinessResponse}})
 async def readiness_check() -> ReadinessResponse:
     """
     Readiness check endpoint.
@@ -87,7 +89,7 @@ async def readiness_check() -> ReadinessResponse:
 
     all_ready = all(checks.values())
 
-    return ReadinessResponse(
+    return ReadinessResponse.model_construct(
         ready=all_ready,
         checks=checks,
     )
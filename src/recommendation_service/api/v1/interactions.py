@@ -1,21 +1,69 @@
 """User interaction tracking API endpoints."""
 
+import asyncio
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+import structlog
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import bindparam, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from recommendation_service.infrastructure.database.connection import get_session
-from recommendation_service.infrastructure.redis import CacheService, get_redis_client
+from recommendation_service.config import get_settings
+from recommendation_service.infrastructure.database.connection import (
+    copy_records,
+    get_session,
+    get_session_factory,
+)
+from recommendation_service.infrastructure.redis import CacheService, get_cache
 from recommendation_service.services.user_preference import UserPreferenceService
 
+logger = structlog.get_logger()
 router = APIRouter()
 
+INSERT_SQL = text("""
+    INSERT INTO recommender.user_interactions
+    (
+        external_user_id,
+        external_product_id,
+        interaction_type,
+        search_query,
+        recommendation_context,
+        recommendation_position,
+        session_id,
+        extra_data
+    )
+    VALUES
+    (
+        :user_id,
+        :product_id,
+        :interaction_type,
+        :search_query,
+        :recommendation_context,
+        :recommendation_position,
+        :session_id,
+        CAST(:extra_data AS jsonb)
+    )
+    RETURNING id
+""")
+
+# extra_data is bound as pre-serialized JSON text; most interactions carry none
+_EMPTY_JSON = "{}"
+
+BATCH_COPY_COLUMNS = (
+    "external_user_id",
+    "external_product_id",
+    "interaction_type",
+    "search_query",
+    "recommendation_context",
+    "recommendation_position",
+    "session_id",
+    "extra_data",
+)
+
 
 # =============================================================================
 # Enums and Models
@@ -35,6 +83,21 @@ class InteractionType(str, Enum):
     RECOMMENDATION_VIEW = "recommendation_view"
 
 
+# Interaction types that must reference a product
+_PRODUCT_INTERACTIONS: frozenset[InteractionType] = frozenset({
+    InteractionType.VIEW,
+    InteractionType.CART_ADD,
+    InteractionType.CART_REMOVE,
+    InteractionType.PURCHASE,
+    InteractionType.WISHLIST_ADD,
+    InteractionType.RECOMMENDATION_CLICK,
+    InteractionType.RECOMMENDATION_VIEW,
+})
+
+# The DB enum stores member names ('VIEW', 'CART_ADD', ...)
+_TYPE_NAME: dict[InteractionType, str] = {t: t.name for t in InteractionType}
+
+
 class InteractionRequest(BaseModel):
     """Request model for tracking a user interaction."""
 
@@ -59,7 +122,7 @@ class InteractionResponse(BaseModel):
 
     success: bool
     interaction_id: str
-    recorded_at: str
+    recorded_at: datetime
 
 
 class BatchInteractionRequest(BaseModel):
@@ -78,7 +141,53 @@ class BatchInteractionResponse(BaseModel):
     success: bool
     recorded_count: int
     failed_count: int
-    recorded_at: str
+    recorded_at: datetime
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _validation_error(interaction: InteractionRequest) -> str | None:
+    """Return why an interaction is missing a field its type requires, if it is."""
+    if interaction.interaction_type in _PRODUCT_INTERACTIONS and not interaction.product_id:
+        return f"product_id is required for {interaction.interaction_type.value} interactions"
+    if interaction.interaction_type == InteractionType.SEARCH and not interaction.search_query:
+        return "search_query is required for search interactions"
+    return None
+
+
+async def update_user_preferences(user_ids: set[str]) -> None:
+    """Recompute preference vectors for several users concurrently.
+
+    Each update commits on its own session, so they run in parallel sessions;
+    concurrency is capped at the pool size so a large batch can't exhaust it.
+    """
+    session_factory = get_session_factory()
+    semaphore = asyncio.Semaphore(get_settings().db_pool_size)
+
+    async def update(user_id: str) -> None:
+        async with semaphore, session_factory() as session:
+            await UserPreferenceService(session).update_user_preference(user_id)
+
+    await asyncio.gather(*(update(user_id) for user_id in user_ids))
+
+
+async def refresh_user_preferences(user_ids: set[str], cache: CacheService) -> None:
+    """Recompute preferences and drop cached vectors after interactions commit.
+
+    Runs as a background task once the response has been sent, so failures are
+    logged rather than surfaced to the client.
+    """
+    try:
+        await update_user_preferences(user_ids)
+        await cache.delete_many(
+            *(f"user_emb:{user_id}" for user_id in user_ids),
+            *(f"user_prefs:{user_id}" for user_id in user_ids),
+        )
+    except Exception as e:
+        logger.warning("Failed to refresh user preferences", user_ids=list(user_ids), error=str(e))
 
 
 # =============================================================================
@@ -86,10 +195,12 @@ class BatchInteractionResponse(BaseModel):
 # =============================================================================
 
 
-@router.post("", response_model=InteractionResponse)
+@router.post("", response_model=None, responses={200: {"model": InteractionResponse}})
 async def track_interaction(
     interaction: InteractionRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> InteractionResponse:
     """
     Track a single user interaction.
@@ -115,90 +226,44 @@ async def track_interaction(
     - Track `recommendation_click` when user clicks a recommendation
     - Include `recommendation_context` and `recommendation_position` for attribution
     """
-    # Validate that product_id is provided for product interactions
-    product_interactions = {
-        InteractionType.VIEW,
-        InteractionType.CART_ADD,
-        InteractionType.CART_REMOVE,
-        InteractionType.PURCHASE,
-        InteractionType.WISHLIST_ADD,
-        InteractionType.RECOMMENDATION_CLICK,
-        InteractionType.RECOMMENDATION_VIEW,
-    }
-
-    if interaction.interaction_type in product_interactions and not interaction.product_id:
-        raise HTTPException(
-            status_code=400,
-            detail=f"product_id is required for {interaction.interaction_type.value} interactions",
-        )
-
-    if interaction.interaction_type == InteractionType.SEARCH and not interaction.search_query:
-        raise HTTPException(
-            status_code=400,
-            detail="search_query is required for search interactions",
-        )
-
-    insert_query = text("""
-        INSERT INTO recommender.user_interactions
-        (
-            external_user_id,
-            external_product_id,
-            interaction_type,
-            search_query,
-            recommendation_context,
-            recommendation_position,
-            session_id,
-            extra_data
-        )
-        VALUES
-        (
-            :user_id,
-            :product_id,
-            :interaction_type,
-            :search_query,
-            :recommendation_context,
-            :recommendation_position,
-            :session_id,
-            :extra_data
-        )
-        RETURNING id
-    """).bindparams(bindparam("extra_data", type_=JSONB))
+    # Validate that product_id/search_query are provided where the type needs them
+    if error := _validation_error(interaction):
+        raise HTTPException(status_code=400, detail=error)
 
     result = await session.execute(
-        insert_query,
+        INSERT_SQL,
         {
             "user_id": interaction.user_id,
             "product_id": interaction.product_id,
-            "interaction_type": interaction.interaction_type.name,
+            "interaction_type": _TYPE_NAME[interaction.interaction_type],
             "search_query": interaction.search_query,
             "recommendation_context": interaction.recommendation_context,
             "recommendation_position": interaction.recommendation_position,
             "session_id": interaction.session_id,
-            "extra_data": interaction.metadata or {},
+            "extra_data": (
+                orjson.dumps(interaction.metadata).decode() if interaction.metadata else _EMPTY_JSON
+            ),
         },
     )
     interaction_id = str(result.scalar_one())
     await session.commit()
 
-    # Update user preferences and invalidate cache
-    prefs = UserPreferenceService(session)
-    await prefs.update_user_preference(interaction.user_id)
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    await cache.delete(f"user_emb:{interaction.user_id}")
-    await cache.delete(f"user_prefs:{interaction.user_id}")
+    # Update user preferences and invalidate cache after the response is sent
+    background_tasks.add_task(refresh_user_preferences, {interaction.user_id}, cache)
 
-    return InteractionResponse(
+    return InteractionResponse.model_construct(
         success=True,
         interaction_id=interaction_id,
-        recorded_at=datetime.now(timezone.utc).isoformat(),
+        recorded_at=datetime.now(timezone.utc),
     )
 
 
-@router.post("/batch", response_model=BatchInteractionResponse)
+@router.post("/batch", response_model=None, responses={200: {"model": BatchInteractionResponse}})
 async def track_interactions_batch(
     request: BatchInteractionRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
 ) -> BatchInteractionResponse:
     """
     Track multiple user interactions in a single request.
@@ -210,8 +275,9 @@ async def track_interactions_batch(
 
     **Limits:**
     - Maximum 100 interactions per request
-    - Each interaction is validated independently
-    - Partial success is possible (some may fail)
+    - Each interaction is validated like a single interaction; the first
+      invalid one rejects the request with a 400 naming its index
+    - The batch is all-or-nothing: every interaction is recorded or none is
     """
     if not request.interactions:
         raise HTTPException(
@@ -219,67 +285,40 @@ async def track_interactions_batch(
             detail="interactions list must not be empty",
         )
 
-    insert_query = text("""
-        INSERT INTO recommender.user_interactions
-        (
-            external_user_id,
-            external_product_id,
-            interaction_type,
-            search_query,
-            recommendation_context,
-            recommendation_position,
-            session_id,
-            extra_data
-        )
-        VALUES
+    for index, interaction in enumerate(request.interactions):
+        if error := _validation_error(interaction):
+            raise HTTPException(status_code=400, detail=f"interactions[{index}]: {error}")
+
+    rows = [
         (
-            :user_id,
-            :product_id,
-            :interaction_type,
-            :search_query,
-            :recommendation_context,
-            :recommendation_position,
-            :session_id,
-            :extra_data
+            interaction.user_id,
+            interaction.product_id,
+            _TYPE_NAME[interaction.interaction_type],
+            interaction.search_query,
+            interaction.recommendation_context,
+            interaction.recommendation_position,
+            interaction.session_id,
+            orjson.dumps(interaction.metadata).decode() if interaction.metadata else _EMPTY_JSON,
         )
-    """).bindparams(bindparam("extra_data", type_=JSONB))
-
-    payloads = [
-        {
-            "user_id": interaction.user_id,
-            "product_id": interaction.product_id,
-            "interaction_type": interaction.interaction_type.name,
-            "search_query": interaction.search_query,
-            "recommendation_context": interaction.recommendation_context,
-            "recommendation_position": interaction.recommendation_position,
-            "session_id": interaction.session_id,
-            "extra_data": interaction.metadata or {},
-        }
         for interaction in request.interactions
     ]
 
-    await session.execute(insert_query, payloads)
-    await session.commit()
+    # Stream the whole batch in one binary COPY. Nothing has run on this session
+    # yet, so the COPY commits on its own: all rows or none.
+    await copy_records(session, "user_interactions", BATCH_COPY_COLUMNS, rows)
 
-    # Update preferences for affected users and invalidate caches
+    # Update preferences for affected users and invalidate caches after the response is sent
     affected_users = {interaction.user_id for interaction in request.interactions}
-    prefs = UserPreferenceService(session)
-    for user_id in affected_users:
-        await prefs.update_user_preference(user_id)
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    for user_id in affected_users:
-        await cache.delete(f"user_emb:{user_id}")
-        await cache.delete(f"user_prefs:{user_id}")
+    background_tasks.add_task(refresh_user_preferences, affected_users, cache)
 
     recorded_count = len(request.interactions)
     failed_count = 0
 
-    return BatchInteractionResponse(
+    return BatchInteractionResponse.model_construct(
         success=failed_count == 0,
         recorded_count=recorded_count,
         failed_count=failed_count,
-        recorded_at=datetime.now(timezone.utc).isoformat(),
+        recorded_at=datetime.now(timezone.utc),
     )
 
 
@@ -1,16 +1,26 @@
 """Recommendation API endpoints."""
 
-from typing import Annotated
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from hashlib import blake2b
+from typing import Annotated, Any, Literal
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from recommendation_service.config import Settings, get_settings
-from recommendation_service.infrastructure.database.connection import get_session
-from recommendation_service.infrastructure.redis import CacheService, get_redis_client
+from recommendation_service.config import get_settings
+from recommendation_service.infrastructure.database.connection import (
+    copy_records,
+    get_autocommit_session_factory,
+    get_session,
+    get_session_factory,
+)
+from recommendation_service.infrastructure.redis import CacheService, get_cache
 from recommendation_service.services.recommendation_engine_v2 import (
     HybridRecommendationEngine,
 )
@@ -19,6 +29,25 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Upper bound on products in a cart recommendation request
+MAX_CART_PRODUCTS = 50
+
+# Not personalized (co-purchases only), so shared caches may serve it
+PUBLIC_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=600"
+
+# Searches are queued and written in batches by start_search_tracker()
+SEARCH_TRACKING_BATCH_SIZE = 256
+SEARCH_TRACKING_INTERVAL_SECONDS = 0.1
+SEARCH_QUEUE_MAX_SIZE = 10_000
+
+# created_at is left to its now() default
+SEARCH_COPY_COLUMNS = (
+    "external_user_id",
+    "interaction_type",
+    "search_query",
+    "recommendation_request_id",
+)
+
 
 class RecommendedProduct(BaseModel):
     """A recommended product with relevance score."""
@@ -40,16 +69,261 @@ class RecommendationResponse(BaseModel):
     request_id: str
     context: str
     user_id: str | None = None
-    generated_at: str
+    generated_at: datetime
+
+
+class RecommendationRequestItem(BaseModel):
+    """One carousel in a batch recommendation request."""
+
+    context: Literal["homepage", "product_page", "cart", "frequently_bought_together"]
+    user_id: str | None = None
+    product_id: str | None = None
+    cart_product_ids: list[str] | None = Field(None, max_length=MAX_CART_PRODUCTS)
+    limit: int = Field(8, ge=1, le=50)
+
+
+class BatchRecommendationRequest(BaseModel):
+    """Request for several recommendation carousels at once."""
+
+    items: list[RecommendationRequestItem] = Field(..., min_length=1, max_length=20)
+
+
+class BatchRecommendationResponse(BaseModel):
+    """Responses for a batch request, in the same order as the request items."""
+
+    results: list[RecommendationResponse]
+
+
+_PRODUCT_FIELDS = tuple(RecommendedProduct.model_fields)
+
+
+def _response_payload(result: dict[str, Any]) -> dict[str, Any]:
+    """Shape engine output as a RecommendationResponse body.
+
+    The engine's output is trusted, so the dict goes straight to orjson instead
+    of through pydantic and jsonable_encoder; only the product fields are kept,
+    dropping the engine's internal scoring keys.
+    """
+    return {
+        "recommendations": [
+            {field: p.get(field) for field in _PRODUCT_FIELDS} for p in result["recommendations"]
+        ],
+        "request_id": result["request_id"],
+        "context": result["context"],
+        "user_id": result["user_id"],
+        "generated_at": result["generated_at"],
+    }
+
+
+def recommendations_etag(recommendations: list[dict[str, Any]]) -> str:
+    """Weak ETag over the recommended products.
+
+    request_id and generated_at differ on every call, so they are left out:
+    two responses with the same products in the same order are equivalent.
+    """
+    payload = orjson.dumps(recommendations, option=orjson.OPT_SERIALIZE_NUMPY)
+    return f'W/"{blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def _private_cache_control() -> str:
+    return f"private, max-age={get_settings().cache_recommendation_response_ttl}"
+
+
+def _conditional_response(
+    result: dict[str, Any], request: Request, cache_control: str
+) -> Response:
+    """Answer 304 if the client already holds these recommendations, else send them.
+
+    Both carry the ETag and the Cache-Control policy so browsers can skip
+    repeat requests entirely.
+    """
+    payload = _response_payload(result)
+    headers = {
+        "ETag": recommendations_etag(payload["recommendations"]),
+        "Cache-Control": cache_control,
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+def _validate_batch_item(index: int, item: RecommendationRequestItem) -> None:
+    """Apply the same requirements as the matching single-context endpoint."""
+    if item.context in ("homepage", "cart") and not item.user_id:
+        raise HTTPException(
+            status_code=400,
+            detail=f"items[{index}]: user_id is required for {item.context}",
+        )
+    if item.context in ("product_page", "frequently_bought_together") and not item.product_id:
+        raise HTTPException(
+            status_code=400,
+            detail=f"items[{index}]: product_id is required for {item.context}",
+        )
+    if item.context == "cart":
+        if not item.cart_product_ids:
+            raise HTTPException(
+                status_code=400,
+                detail=f"items[{index}]: cart_product_ids must not be empty",
+            )
+        if item.limit > 20:
+            raise HTTPException(status_code=400, detail=f"items[{index}]: limit must be <= 20")
+    if item.context == "frequently_bought_together" and item.limit > 10:
+        raise HTTPException(status_code=400, detail=f"items[{index}]: limit must be <= 10")
+
+
+def get_recommendation_engine(
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache),
+) -> HybridRecommendationEngine:
+    """Build an engine on the request's session and the shared cache service.
+
+    FastAPI caches dependencies per request, so an endpoint that also asks for
+    get_session gets the same session the engine uses.
+    """
+    return HybridRecommendationEngine(session, cache=cache)
+
+
+SearchEvent = tuple[str, str, str, str]
+
+# Created by start_search_tracker() so it binds to the running event loop
+_search_events: asyncio.Queue[SearchEvent] | None = None
+
+
+def track_search(user_id: str, search_query: str, request_id: str) -> None:
+    """Queue a SEARCH interaction for the search tracker to write."""
+    if _search_events is None:
+        logger.warning("Search tracker not running, dropping interaction", user_id=user_id)
+        return
+    try:
+        _search_events.put_nowait((user_id, "SEARCH", search_query, request_id))
+    except asyncio.QueueFull:
+        logger.warning("Search tracking queue full, dropping interaction", user_id=user_id)
+
+
+async def _write_search_events(events: list[SearchEvent]) -> None:
+    try:
+        async with get_autocommit_session_factory()() as session:
+            await copy_records(session, "user_interactions", SEARCH_COPY_COLUMNS, events)
+    except Exception as e:
+        logger.warning("Failed to track search interactions", count=len(events), error=str(e))
+
+
+def _take_search_events(
+    queue: asyncio.Queue[SearchEvent], events: list[SearchEvent]
+) -> list[SearchEvent]:
+    while len(events) < SEARCH_TRACKING_BATCH_SIZE and not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+async def _drain_search_events(queue: asyncio.Queue[SearchEvent], interval: float) -> None:
+    global _search_events
+    try:
+        while True:
+            events = _take_search_events(queue, [await queue.get()])
+            await _write_search_events(events)
+            await asyncio.sleep(interval)
+    except asyncio.CancelledError:
+        # Flush what was queued before shutdown
+        while events := _take_search_events(queue, []):
+            await _write_search_events(events)
+        raise
+    finally:
+        if _search_events is queue:
+            _search_events = None
+
+
+def start_search_tracker(
+    interval: float = SEARCH_TRACKING_INTERVAL_SECONDS,
+) -> asyncio.Task:
+    """Start writing queued SEARCH interactions in batches in the background.
+
+    Searches are tracked off the request path; each tick writes up to
+    SEARCH_TRACKING_BATCH_SIZE rows in one round-trip. The queue is created
+    here, on the running loop, so each lifespan gets its own. Cancel the
+    returned task on shutdown (before closing the database) and await it to
+    flush.
+    """
+    global _search_events
+    _search_events = asyncio.Queue(maxsize=SEARCH_QUEUE_MAX_SIZE)
+    return asyncio.create_task(_drain_search_events(_search_events, interval))
+
+
+_inflight: dict[str, asyncio.Future] = {}
+
 
+async def coalesce(key: str, compute: Callable[[], Awaitable[dict[str, Any]]]) -> dict[str, Any]:
+    """Share one in-flight computation between concurrent identical requests.
 
-@router.get("/homepage", response_model=RecommendationResponse)
+    Only for non-personalized results: during a spike on one product, callers
+    arriving while the first is still running await its result instead of
+    running the engine pipeline again. If the caller computing the result is
+    cancelled (its client disconnected), waiting callers start over instead
+    of failing with it.
+    """
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        try:
+            # Shielded so a follower disconnecting doesn't cancel the shared future
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled() or asyncio.current_task().cancelling():
+                raise
+            # The leader was cancelled, not this caller; the first follower to
+            # get here becomes the new leader and the rest wait on it
+            return await coalesce(key, compute)
+
+    future = asyncio.get_running_loop().create_future()
+    # Mark the outcome as retrieved even when no follower awaited it
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight[key] = future
+    try:
+        result = await compute()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+async def _dispatch(
+    engine: HybridRecommendationEngine, item: RecommendationRequestItem
+) -> dict[str, Any]:
+    if item.context == "homepage":
+        return await engine.get_homepage_recommendations(user_id=item.user_id, limit=item.limit)
+    if item.context == "product_page":
+        return await engine.get_similar_products(
+            product_id=item.product_id, user_id=item.user_id, limit=item.limit
+        )
+    if item.context == "cart":
+        return await engine.get_cart_recommendations(
+            user_id=item.user_id,
+            cart_product_ids=list(dict.fromkeys(item.cart_product_ids)),
+            limit=item.limit,
+        )
+    return await engine.get_frequently_bought_together(
+        product_id=item.product_id, limit=item.limit
+    )
+
+
+@router.get(
+    "/homepage",
+    response_model=None,
+    responses={200: {"model": RecommendationResponse}},
+)
 async def get_homepage_recommendations(
     user_id: Annotated[str, Query(description="User ID for personalization")],
+    request: Request,
     limit: Annotated[int, Query(ge=1, le=50)] = 12,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> RecommendationResponse:
+    engine: HybridRecommendationEngine = Depends(get_recommendation_engine),
+) -> Response:
     """
     Get personalized homepage recommendations for a user.
 
@@ -66,30 +340,23 @@ async def get_homepage_recommendations(
     - Homepage "Recommended for You" section
     - Personalized product carousel
     """
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    engine = HybridRecommendationEngine(session, cache=cache)
     result = await engine.get_homepage_recommendations(user_id=user_id, limit=limit)
 
-    return RecommendationResponse(
-        recommendations=[
-            RecommendedProduct(**p) for p in result["recommendations"]
-        ],
-        request_id=result["request_id"],
-        context=result["context"],
-        user_id=result["user_id"],
-        generated_at=result["generated_at"],
-    )
+    return _conditional_response(result, request, _private_cache_control())
 
 
-@router.get("/product/{product_id}", response_model=RecommendationResponse)
+@router.get(
+    "/product/{product_id}",
+    response_model=None,
+    responses={200: {"model": RecommendationResponse}},
+)
 async def get_similar_products(
     product_id: str,
+    request: Request,
     user_id: Annotated[str | None, Query(description="Optional user ID for personalization")] = None,
     limit: Annotated[int, Query(ge=1, le=50)] = 8,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> RecommendationResponse:
+    engine: HybridRecommendationEngine = Depends(get_recommendation_engine),
+) -> Response:
     """
     Get similar products for a product page.
 
@@ -106,32 +373,33 @@ async def get_similar_products(
     - Product page "Similar Products" section
     - "You might also like" carousel
     """
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    engine = HybridRecommendationEngine(session, cache=cache)
-    result = await engine.get_similar_products(
-        product_id=product_id, user_id=user_id, limit=limit
-    )
+    if user_id:
+        result = await engine.get_similar_products(
+            product_id=product_id, user_id=user_id, limit=limit
+        )
+    else:
+        result = await coalesce(
+            f"similar:{product_id}:{limit}",
+            lambda: engine.get_similar_products(product_id=product_id, limit=limit),
+        )
 
-    return RecommendationResponse(
-        recommendations=[
-            RecommendedProduct(**p) for p in result["recommendations"]
-        ],
-        request_id=result["request_id"],
-        context=result["context"],
-        user_id=result["user_id"],
-        generated_at=result["generated_at"],
-    )
+    return _conditional_response(result, request, _private_cache_control())
 
 
-@router.get("/cart", response_model=RecommendationResponse)
+@router.get(
+    "/cart",
+    response_model=None,
+    responses={200: {"model": RecommendationResponse}},
+)
 async def get_cart_recommendations(
     user_id: Annotated[str, Query(description="User ID")],
-    cart_product_ids: Annotated[list[str], Query(description="Product IDs in cart")],
+    cart_product_ids: Annotated[
+        list[str], Query(description="Product IDs in cart", max_length=MAX_CART_PRODUCTS)
+    ],
+    request: Request,
     limit: Annotated[int, Query(ge=1, le=20)] = 6,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> RecommendationResponse:
+    engine: HybridRecommendationEngine = Depends(get_recommendation_engine),
+) -> Response:
     """
     Get recommendations based on cart contents.
 
@@ -154,35 +422,27 @@ async def get_cart_recommendations(
             status_code=400,
             detail="cart_product_ids must not be empty",
         )
+    # Repeated SKUs add nothing to the aggregate embedding
+    cart_product_ids = list(dict.fromkeys(cart_product_ids))
 
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    engine = HybridRecommendationEngine(session, cache=cache)
     result = await engine.get_cart_recommendations(
         user_id=user_id, cart_product_ids=cart_product_ids, limit=limit
     )
 
-    return RecommendationResponse(
-        recommendations=[
-            RecommendedProduct(**p) for p in result["recommendations"]
-        ],
-        request_id=result["request_id"],
-        context=result["context"],
-        user_id=result["user_id"],
-        generated_at=result["generated_at"],
-    )
+    return _conditional_response(result, request, _private_cache_control())
 
 
 @router.get(
     "/frequently-bought-together/{product_id}",
-    response_model=RecommendationResponse,
+    response_model=None,
+    responses={200: {"model": RecommendationResponse}},
 )
 async def get_frequently_bought_together(
     product_id: str,
+    request: Request,
     limit: Annotated[int, Query(ge=1, le=10)] = 4,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> RecommendationResponse:
+    engine: HybridRecommendationEngine = Depends(get_recommendation_engine),
+) -> Response:
     """
     Get frequently bought together products.
 
@@ -199,35 +459,29 @@ async def get_frequently_bought_together(
     - Product page "Frequently Bought Together" section
     - Bundle suggestions
     """
-    redis_client = await get_redis_client()
-    cache = CacheService(redis_client)
-    engine = HybridRecommendationEngine(session, cache=cache)
-    result = await engine.get_frequently_bought_together(
-        product_id=product_id, limit=limit
+    result = await coalesce(
+        f"fbt:{product_id}:{limit}",
+        lambda: engine.get_frequently_bought_together(product_id=product_id, limit=limit),
     )
 
-    return RecommendationResponse(
-        recommendations=[
-            RecommendedProduct(**p) for p in result["recommendations"]
-        ],
-        request_id=result["request_id"],
-        context=result["context"],
-        user_id=result["user_id"],
-        generated_at=result["generated_at"],
-    )
+    return _conditional_response(result, request, PUBLIC_CACHE_CONTROL)
 
 
-@router.get("/search", response_model=RecommendationResponse)
+@router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": RecommendationResponse}},
+)
 async def get_search_recommendations(
     query: Annotated[str, Query(description="Search query text", min_length=1, max_length=500)],
+    request: Request,
     user_id: Annotated[
         str | None, Query(description="Optional user ID for personalization")
     ] = None,
     limit: Annotated[int, Query(ge=1, le=50)] = 12,
     category: Annotated[str | None, Query(description="Optional category filter")] = None,
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> RecommendationResponse:
+    engine: HybridRecommendationEngine = Depends(get_recommendation_engine),
+) -> Response:
     """
     Get search-based product recommendations.
 
@@ -244,35 +498,62 @@ async def get_search_recommendations(
     - Search results page
     - "Search for Fridge" -> returns relevant fridge products ranked by relevance
     """
-    engine = HybridRecommendationEngine(session)
     result = await engine.get_search_recommendations(
         query=query, user_id=user_id, limit=limit, category=category
     )
 
-    # Track search interaction
     if user_id:
-        try:
-            track_query = text("""
-                INSERT INTO recommender.user_interactions
-                (external_user_id, interaction_type, search_query,
-                 recommendation_request_id, created_at)
-                VALUES (:user_id, 'SEARCH', :search_query, :request_id, NOW())
-            """)
-            await session.execute(track_query, {
-                "user_id": user_id,
-                "search_query": query,
-                "request_id": result["request_id"],
-            })
-            await session.commit()
-        except Exception as e:
-            logger.warning("Failed to track search interaction", error=str(e))
-
-    return RecommendationResponse(
-        recommendations=[
-            RecommendedProduct(**p) for p in result["recommendations"]
-        ],
-        request_id=result["request_id"],
-        context=result["context"],
-        user_id=result["user_id"],
-        generated_at=result["generated_at"],
-    )
+        track_search(user_id, query, result["request_id"])
+
+    return _conditional_response(result, request, _private_cache_control())
+
+
+@router.post(
+    "/batch", response_model=None, responses={200: {"model": BatchRecommendationResponse}}
+)
+async def get_batch_recommendations(
+    request: BatchRecommendationRequest,
+    cache: CacheService = Depends(get_cache),
+) -> ORJSONResponse:
+    """
+    Get several recommendation carousels in one request.
+
+    Each item names a context (`homepage`, `product_page`, `cart`,
+    `frequently_bought_together`) plus the parameters of the matching
+    single endpoint. Items run concurrently and identical items are only
+    computed once. Results are returned in request order.
+
+    **Limits:**
+    - Maximum 20 items per request
+
+    **Usage in UI:**
+    - Pages that render several rails at once (homepage, product page)
+    """
+    for index, item in enumerate(request.items):
+        _validate_batch_item(index, item)
+
+    # A session can't run queries concurrently, so each item gets its own;
+    # concurrency is capped at the pool size
+    session_factory = get_session_factory()
+    semaphore = asyncio.Semaphore(get_settings().db_pool_size)
+
+    async def run(item: RecommendationRequestItem) -> dict[str, Any]:
+        async with semaphore, session_factory() as session:
+            engine = HybridRecommendationEngine(session, cache=cache)
+            return await _dispatch(engine, item)
+
+    tasks: dict[str, asyncio.Task] = {}
+    keys = []
+    try:
+        # If one item fails the group cancels the rest, so no session outlives the request
+        async with asyncio.TaskGroup() as tg:
+            for item in request.items:
+                key = item.model_dump_json()
+                if key not in tasks:
+                    tasks[key] = tg.create_task(run(item))
+                keys.append(key)
+    except ExceptionGroup as group:
+        # Fail the request with the first error, as a single endpoint would
+        raise group.exceptions[0] from None
+
+    return ORJSONResponse({"results": [_response_payload(tasks[key].result()) for key in keys]})
@@ -1,6 +1,7 @@
 """API v1 router that aggregates all endpoint routers."""
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from recommendation_service.api.v1 import (
     analytics,
@@ -13,37 +14,47 @@ from recommendation_service.api.v1 import (
 
 api_router = APIRouter()
 
+# Handlers on the orjson-backed routers build their responses with model_construct()
+# and set response_model=None (documenting the model via responses=) so the trusted
+# payload is not validated again on the way out.
+
 api_router.include_router(
     health.router,
     tags=["Health"],
+    default_response_class=ORJSONResponse,
 )
 
 api_router.include_router(
     recommendations.router,
     prefix="/recommendations",
     tags=["Recommendations"],
+    default_response_class=ORJSONResponse,
 )
 
 api_router.include_router(
     interactions.router,
     prefix="/interactions",
     tags=["Interactions"],
+    default_response_class=ORJSONResponse,
 )
 
 api_router.include_router(
     analytics.router,
     prefix="/analytics",
     tags=["Analytics"],
+    default_response_class=ORJSONResponse,
 )
 
 api_router.include_router(
     evaluation.router,
     prefix="/evaluation",
     tags=["Evaluation"],
+    default_response_class=ORJSONResponse,
 )
 
 api_router.include_router(
     benchmarks.router,
     prefix="/benchmarks",
     tags=["Benchmarks"],
+    default_response_class=ORJSONResponse,
 )
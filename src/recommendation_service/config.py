@@ -1,6 +1,6 @@
 """Application configuration management."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Read once at startup; freezing lets the derived URLs below be cached safely
+        frozen=True,
     )
 
     app_name: str = "reemio-recommender"
@@ -44,7 +46,7 @@ class Settings(BaseSettings):
     postgres_password: str = ""
     postgres_db: str = "reemio_recommender"
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct PostgreSQL connection URL."""
         return (
@@ -52,7 +54,7 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         """Construct synchronous PostgreSQL connection URL (for Alembic)."""
         return (
@@ -68,8 +70,9 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_password: str = ""
     redis_db: int = 0
+    redis_max_connections: int = 32
 
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Construct Redis connection URL."""
         if self.redis_password:
@@ -78,12 +81,12 @@ class Settings(BaseSettings):
     celery_broker_url: str = ""
     celery_result_backend: str = ""
 
-    @property
+    @cached_property
     def celery_broker(self) -> str:
         """Get Celery broker URL, defaulting to Redis URL."""
         return self.celery_broker_url or self.redis_url
 
-    @property
+    @cached_property
     def celery_backend(self) -> str:
         """Get Celery result backend URL, defaulting to Redis URL."""
         return self.celery_result_backend or self.redis_url
@@ -127,6 +130,7 @@ class Settings(BaseSettings):
     cache_user_embedding_ttl: int = 3600  # 1 hour
     cache_popular_products_ttl: int = 1800  # 30 minutes (aligned with order sync)
     cache_user_preference_ttl: int = 3600  # 1 hour
+    cache_recommendation_response_ttl: int = 60  # Cache-Control max-age for personalized results
 
     # -------------------------------------------------------------------------
     # Recommendation Settings
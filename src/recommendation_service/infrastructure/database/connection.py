@@ -1,13 +1,23 @@
 """Database connection management."""
 
+from collections.abc import Iterable, Sequence
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from recommendation_service.config import get_settings
 
+# Per-connection cache of prepared statements kept by SQLAlchemy's asyncpg
+# dialect (default 100). The engine and analytics queries are a fixed set of
+# texts, so a larger cache keeps all of them prepared on every pooled connection.
+PREPARED_STATEMENT_CACHE_SIZE = 512
+
+# An HNSW scan returns at most ef_search rows, so this must cover the largest
+# similarity candidate limit (limit * 4 at the maximum limit of 50)
+HNSW_EF_SEARCH = 200
+
 
 def get_async_engine():
     """Create async database engine with connection pooling."""
@@ -20,6 +30,11 @@ def get_async_engine():
         max_overflow=settings.db_max_overflow,
         pool_pre_ping=True,
         pool_recycle=settings.db_pool_recycle,
+        connect_args={
+            "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+            # Request queries are short; JIT compilation costs more than it saves
+            "server_settings": {"jit": "off", "hnsw.ef_search": str(HNSW_EF_SEARCH)},
+        },
     )
 
 
@@ -47,6 +62,61 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+_autocommit_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_autocommit_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get or create a session factory whose statements commit as they run.
+
+    For single-statement fire-and-forget writes: skipping BEGIN/COMMIT turns
+    three round-trips into one. Shares the main engine's connection pool.
+    """
+    global _autocommit_session_factory
+    if _autocommit_session_factory is None:
+        engine = get_session_factory().kw["bind"]
+        _autocommit_session_factory = async_sessionmaker(
+            engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _autocommit_session_factory
+
+
+async def close_database() -> None:
+    """Dispose of the connection pool on shutdown."""
+    global _session_factory, _autocommit_session_factory
+    if _session_factory is not None:
+        await _session_factory.kw["bind"].dispose()
+        _session_factory = None
+    _autocommit_session_factory = None
+
+
+async def copy_records(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> None:
+    """Bulk-write rows into a recommender table with a binary COPY.
+
+    COPY streams the rows in one statement, skipping the per-row bind/execute
+    of an INSERT, and like any single statement applies all rows or none.
+    Columns left out take their defaults.
+
+    It runs on the session's connection but bypasses SQLAlchemy, which only
+    issues BEGIN on the session's first statement. On a session that has not
+    executed anything yet, COPY therefore commits on its own and a later
+    rollback() cannot undo it; call it after other statements only if it
+    should join their transaction.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table, schema_name="recommender", columns=list(columns), records=records
+    )
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session as async context manager."""
@@ -78,14 +78,14 @@ def run_migrations_online() -> None:
         connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {RECOMMENDER_SCHEMA}"))
         connection.commit()
 
-        # Try to create pgvector extension (may fail if not installed)
+        # Try to create pgvector extension (embeddings are stored as vector(384))
         try:
             connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
             connection.commit()
         except Exception as e:
             connection.rollback()
-            print(f"Note: pgvector extension not available, using JSON for embeddings.")
-            print("Install pgvector for native vector search functionality.")
+            print("Note: pgvector extension not available.")
+            print("Install pgvector before upgrading past revision f1a9c3e5b7d2.")
 
         # Create pg_trgm extension for fuzzy text search
         try:
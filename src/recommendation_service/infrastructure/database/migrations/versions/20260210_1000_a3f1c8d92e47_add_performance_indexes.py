@@ -18,30 +18,35 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Partial index for _search_similar_products():
-    # WHERE is_active = true AND embedding IS NOT NULL ORDER BY popularity_score DESC
-    # Only indexes active products with embeddings, much smaller than a full index.
-    op.execute("""
-        CREATE INDEX ix_pe_active_embedding_popularity
-        ON recommender.product_embeddings (popularity_score DESC NULLS LAST)
-        WHERE is_active = true AND embedding IS NOT NULL
-    """)
-
-    # Filtered index for collaborative filtering queries:
-    # Speeds up the recommended_products CTE that filters by high-value interaction types.
-    op.execute("""
-        CREATE INDEX ix_ui_product_type_purchase
-        ON recommender.user_interactions (external_product_id, external_user_id)
-        WHERE interaction_type IN ('PURCHASE', 'CART_ADD', 'WISHLIST_ADD')
-    """)
-
-    # Composite index for product embedding joins in collaborative filtering
-    op.create_index(
-        "ix_pe_external_product_active",
-        "product_embeddings",
-        ["external_product_id", "is_active"],
-        schema="recommender",
-    )
+    # Built CONCURRENTLY so live reads and writes are not blocked; that cannot
+    # run inside a transaction
+    with op.get_context().autocommit_block():
+        # Partial index for _search_similar_products():
+        # WHERE is_active = true AND embedding IS NOT NULL ORDER BY popularity_score DESC
+        # Only indexes active products with embeddings, much smaller than a full index.
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_active_embedding_popularity
+            ON recommender.product_embeddings (popularity_score DESC NULLS LAST)
+            WHERE is_active = true AND embedding IS NOT NULL
+        """)
+
+        # Filtered index for collaborative filtering queries:
+        # Speeds up the recommended_products CTE that filters by high-value interaction types.
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ui_product_type_purchase
+            ON recommender.user_interactions (external_product_id, external_user_id)
+            WHERE interaction_type IN ('PURCHASE', 'CART_ADD', 'WISHLIST_ADD')
+        """)
+
+        # Composite index for product embedding joins in collaborative filtering
+        op.create_index(
+            "ix_pe_external_product_active",
+            "product_embeddings",
+            ["external_product_id", "is_active"],
+            schema="recommender",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -8,6 +8,7 @@ Revises: 016b2a819b85
 Create Date: 2026-02-10 11:00:00.000000+00:00
 """
 
+import sqlalchemy as sa
 from alembic import op
 
 revision = "b7e2f4a19c83"
@@ -15,6 +16,8 @@ down_revision = "016b2a819b85"
 branch_labels = None
 depends_on = None
 
+BACKFILL_BATCH_SIZE = 10_000
+
 
 def upgrade() -> None:
     # Enable pg_trgm extension for fuzzy matching
@@ -26,29 +29,6 @@ def upgrade() -> None:
         ADD COLUMN IF NOT EXISTS search_vector tsvector
     """)
 
-    # Populate search_vector from existing data
-    # name gets weight A (highest), category gets weight B
-    op.execute("""
-        UPDATE recommender.product_embeddings
-        SET search_vector =
-            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(category, '')), 'B')
-    """)
-
-    # GIN index on search_vector for fast full-text search
-    op.execute("""
-        CREATE INDEX ix_pe_search_vector
-        ON recommender.product_embeddings
-        USING GIN (search_vector)
-    """)
-
-    # GIN trigram index on name for fuzzy matching
-    op.execute("""
-        CREATE INDEX ix_pe_name_trgm
-        ON recommender.product_embeddings
-        USING GIN (name gin_trgm_ops)
-    """)
-
     # Trigger to auto-update search_vector on INSERT/UPDATE of name or category
     op.execute("""
         CREATE OR REPLACE FUNCTION recommender.update_search_vector()
@@ -70,6 +50,42 @@ def upgrade() -> None:
         EXECUTE FUNCTION recommender.update_search_vector()
     """)
 
+    # Backfill existing rows in id-range batches, each committed on its own, so
+    # a large catalogue never sits in one long transaction. The trigger above
+    # already covers rows written while this runs.
+    # name gets weight A (highest), category gets weight B
+    bind = op.get_bind()
+    max_id = bind.execute(
+        sa.text("SELECT COALESCE(MAX(id), 0) FROM recommender.product_embeddings")
+    ).scalar()
+    backfill = sa.text("""
+        UPDATE recommender.product_embeddings
+        SET search_vector =
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(category, '')), 'B')
+        WHERE id BETWEEN :lo AND :hi
+    """)
+    with op.get_context().autocommit_block():
+        for lo in range(1, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(backfill, {"lo": lo, "hi": lo + BACKFILL_BATCH_SIZE - 1})
+
+        # Indexes are built once the backfill is done, and CONCURRENTLY so reads
+        # and product syncs are not blocked for the length of the build
+
+        # GIN index on search_vector for fast full-text search
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_search_vector
+            ON recommender.product_embeddings
+            USING GIN (search_vector)
+        """)
+
+        # GIN trigram index on name for fuzzy matching
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_name_trgm
+            ON recommender.product_embeddings
+            USING GIN (name gin_trgm_ops)
+        """)
+
 
 def downgrade() -> None:
     op.execute(
@@ -0,0 +1,34 @@
+"""Add partial index for pending cart abandonment reminders.
+
+The abandoned-cart check runs every 15 minutes and only cares about carts
+that have not been recovered and have not had a reminder yet. Indexing just
+those rows keeps the lookup proportional to the pending set instead of the
+full cart_abandonments history, with no refresh step to go stale.
+
+Revision ID: c4d2e8a1f5b3
+Revises: 3364ca759416
+Create Date: 2026-10-15 09:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "c4d2e8a1f5b3"
+down_revision = "3364ca759416"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index for check_abandoned_carts():
+    # WHERE reminder_sent_at IS NULL AND recovered = false
+    #   AND abandonment_detected_at < now() - <delay>
+    op.execute("""
+        CREATE INDEX ix_ca_pending_reminders
+        ON recommender.cart_abandonments (abandonment_detected_at)
+        INCLUDE (external_user_id, external_cart_id)
+        WHERE reminder_sent_at IS NULL AND recovered = false
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS recommender.ix_ca_pending_reminders")
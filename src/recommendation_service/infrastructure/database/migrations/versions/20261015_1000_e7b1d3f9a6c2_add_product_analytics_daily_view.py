@@ -0,0 +1,48 @@
+"""Add daily product interaction rollup for analytics.
+
+The analytics endpoints rank products over date ranges. Counting raw
+user_interactions makes every call O(interactions); this materialized view
+keeps one row per (day, product, interaction type, recommendation context)
+so completed days are read as O(days x products). It only covers days that
+have ended, and the analytics queries read the raw table for anything newer
+than the last aggregated day. refresh_analytics_views rebuilds it nightly.
+
+Revision ID: e7b1d3f9a6c2
+Revises: c4d2e8a1f5b3
+Create Date: 2026-10-15 10:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "e7b1d3f9a6c2"
+down_revision = "c4d2e8a1f5b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW recommender.product_analytics_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            external_product_id,
+            interaction_type,
+            COALESCE(recommendation_context, '') AS recommendation_context,
+            COUNT(*) AS interaction_count
+        FROM recommender.user_interactions
+        WHERE external_product_id IS NOT NULL
+        AND created_at < date_trunc('day', LOCALTIMESTAMP)
+        GROUP BY 1, 2, 3, 4
+    """)
+
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY requires a unique index over all rows.
+    # Leading on day also serves the date-range scans and MAX(day) lookups.
+    op.execute("""
+        CREATE UNIQUE INDEX ix_pad_day_product_type_context
+        ON recommender.product_analytics_daily
+        (day, external_product_id, interaction_type, recommendation_context)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS recommender.product_analytics_daily")
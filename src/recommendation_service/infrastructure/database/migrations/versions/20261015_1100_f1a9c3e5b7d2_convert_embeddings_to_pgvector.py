@@ -0,0 +1,43 @@
+"""Store embeddings as pgvector vector(384) instead of JSON.
+
+The initial schema used JSON because pgvector was not installed on the
+server. JSON arrays have to be parsed row by row before any distance can be
+computed; vector(384) is a fixed 1.5 KB binary value that Postgres compares
+with native distance operators and that ANN indexes can be built on.
+
+Existing JSON arrays are converted in place through their text form, which
+is already valid vector input. Requires the pgvector extension to be
+installable on the server.
+
+Revision ID: f1a9c3e5b7d2
+Revises: e7b1d3f9a6c2
+Create Date: 2026-10-15 11:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "f1a9c3e5b7d2"
+down_revision = "e7b1d3f9a6c2"
+branch_labels = None
+depends_on = None
+
+EMBEDDING_TABLES = ("product_embeddings", "user_preference_embeddings")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    for table in EMBEDDING_TABLES:
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ALTER COLUMN embedding TYPE vector(384)
+            USING CAST(CAST(embedding AS text) AS vector(384))
+        """)
+
+
+def downgrade() -> None:
+    for table in EMBEDDING_TABLES:
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ALTER COLUMN embedding TYPE json
+            USING CAST(CAST(embedding AS text) AS json)
+        """)
@@ -0,0 +1,39 @@
+"""Add HNSW index for product embedding similarity search.
+
+With embeddings stored as vector(384), nearest-neighbour queries ordered by
+cosine distance can walk an HNSW graph instead of scoring every active
+product. The index is partial on the same predicate the similarity search
+filters by, and is built CONCURRENTLY so product syncs keep writing while
+it builds.
+
+hnsw.ef_search is raised per connection (see HNSW_EF_SEARCH in
+database/connection.py) so scans can return the larger candidate limits.
+
+Revision ID: a8d4f2c6e1b9
+Revises: f1a9c3e5b7d2
+Create Date: 2026-10-15 12:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "a8d4f2c6e1b9"
+down_revision = "f1a9c3e5b7d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_embedding_hnsw
+            ON recommender.product_embeddings
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE is_active = true AND embedding IS NOT NULL
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_pe_embedding_hnsw")
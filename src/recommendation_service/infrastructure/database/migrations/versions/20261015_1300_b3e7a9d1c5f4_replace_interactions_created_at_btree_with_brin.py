@@ -0,0 +1,42 @@
+"""Replace the user_interactions created_at B-tree with a BRIN index.
+
+user_interactions is append-only and created_at comes from now() on insert,
+so rows are physically ordered by time. A BRIN index stores one min/max per
+range of pages: a few KB instead of a B-tree that grows with every row, and
+still prunes everything outside the analytics date windows. Per-user
+history ordered by created_at is served by ix_user_interactions_user_type_created,
+so nothing needs the standalone B-tree for ordering or point lookups.
+
+Revision ID: b3e7a9d1c5f4
+Revises: a8d4f2c6e1b9
+Create Date: 2026-10-15 13:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "b3e7a9d1c5f4"
+down_revision = "a8d4f2c6e1b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ui_created_at_brin
+            ON recommender.user_interactions
+            USING BRIN (created_at) WITH (pages_per_range = 32)
+        """)
+        op.execute("""
+            DROP INDEX CONCURRENTLY IF EXISTS
+            recommender.ix_recommender_user_interactions_created_at
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_recommender_user_interactions_created_at
+            ON recommender.user_interactions (created_at)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_ui_created_at_brin")
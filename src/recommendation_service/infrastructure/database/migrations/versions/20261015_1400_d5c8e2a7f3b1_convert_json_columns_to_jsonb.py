@@ -0,0 +1,52 @@
+"""Store JSON payload columns as JSONB.
+
+The initial schema used json, which Postgres keeps as text and re-parses on
+every access, and which cannot be indexed. jsonb is stored pre-parsed and
+supports GIN indexes; cart_snapshot gets a jsonb_path_ops index so
+containment (@>) lookups over abandoned carts can use it.
+
+Revision ID: d5c8e2a7f3b1
+Revises: b3e7a9d1c5f4
+Create Date: 2026-10-15 14:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "d5c8e2a7f3b1"
+down_revision = "b3e7a9d1c5f4"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ("user_preference_embeddings", "top_categories"),
+    ("user_interactions", "extra_data"),
+    ("cart_abandonments", "cart_snapshot"),
+    ("email_campaigns", "recommended_product_ids"),
+]
+
+
+def _alter_type(type_name: str) -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ALTER COLUMN {column} TYPE {type_name} USING CAST({column} AS {type_name})
+        """)
+
+
+def upgrade() -> None:
+    _alter_type("jsonb")
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cart_abandonments_cart_snapshot
+            ON recommender.cart_abandonments USING GIN (cart_snapshot jsonb_path_ops)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_cart_abandonments_cart_snapshot"
+        )
+
+    _alter_type("json")
@@ -0,0 +1,52 @@
+"""Maintain updated_at with a database trigger.
+
+updated_at relied on SQLAlchemy's onupdate, which only fires for ORM
+updates; the raw-SQL upserts had to set it themselves. A BEFORE UPDATE
+trigger keeps it current for every writer, the same way
+update_search_vector maintains product_embeddings.search_vector.
+
+Revision ID: e9f3b6d1a4c7
+Revises: d5c8e2a7f3b1
+Create Date: 2026-10-15 15:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "e9f3b6d1a4c7"
+down_revision = "d5c8e2a7f3b1"
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    "product_embeddings",
+    "user_preference_embeddings",
+    "user_email_preferences",
+    "sync_status",
+]
+
+
+def upgrade() -> None:
+    # now() matches the columns' server default
+    op.execute("""
+        CREATE OR REPLACE FUNCTION recommender.update_updated_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_updated_at
+            BEFORE UPDATE ON recommender.{table}
+            FOR EACH ROW
+            EXECUTE FUNCTION recommender.update_updated_at()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON recommender.{table}")
+    op.execute("DROP FUNCTION IF EXISTS recommender.update_updated_at()")
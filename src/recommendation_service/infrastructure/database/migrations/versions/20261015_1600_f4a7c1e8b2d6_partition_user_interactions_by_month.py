@@ -0,0 +1,191 @@
+"""Partition user_interactions by month on created_at.
+
+user_interactions only grows, and every insert maintains indexes sized to
+the whole history. Range partitioning by month keeps each partition's
+indexes small enough to stay in memory, lets analytics date ranges prune
+whole partitions, and lets old months be detached and archived.
+
+The existing table is renamed to user_interactions_legacy and a partitioned
+parent takes its name, so new writes land in partitions immediately. Legacy
+rows are then copied across in id-range batches, each committed on its own.
+Until the copy finishes, reads of the raw table miss older rows; run this
+outside peak hours.
+
+Postgres requires the primary key to include the partition key, so it
+becomes (id, created_at). Monthly partitions are created from the oldest
+interaction through three months ahead; create_interaction_partitions in
+the sync worker keeps creating them ahead of time, and a DEFAULT partition
+catches anything outside the covered range.
+
+Revision ID: f4a7c1e8b2d6
+Revises: e9f3b6d1a4c7
+Create Date: 2026-10-15 16:00:00.000000+00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "f4a7c1e8b2d6"
+down_revision = "e9f3b6d1a4c7"
+branch_labels = None
+depends_on = None
+
+COPY_BATCH_SIZE = 10_000
+
+INDEXES = {
+    "ix_recommender_user_interactions_external_product_id": "(external_product_id)",
+    "ix_recommender_user_interactions_external_user_id": "(external_user_id)",
+    "ix_recommender_user_interactions_interaction_type": "(interaction_type)",
+    "ix_user_interactions_user_type_created": (
+        "(external_user_id, interaction_type, created_at)"
+    ),
+    "ix_ui_product_type_purchase": (
+        "(external_product_id, external_user_id)"
+        " WHERE interaction_type IN ('PURCHASE', 'CART_ADD', 'WISHLIST_ADD')"
+    ),
+    "ix_ui_created_at_brin": "USING BRIN (created_at) WITH (pages_per_range = 32)",
+}
+
+
+def _drop_indexes() -> None:
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS recommender.{name}")
+
+
+def _create_indexes() -> None:
+    for name, definition in INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON recommender.user_interactions {definition}")
+
+
+def _create_analytics_view() -> None:
+    # Same definition as e7b1d3f9a6c2; the view has to be rebuilt because it
+    # is bound to the table it was created from, not to its name
+    op.execute("""
+        CREATE MATERIALIZED VIEW recommender.product_analytics_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            external_product_id,
+            interaction_type,
+            COALESCE(recommendation_context, '') AS recommendation_context,
+            COUNT(*) AS interaction_count
+        FROM recommender.user_interactions
+        WHERE external_product_id IS NOT NULL
+        AND created_at < date_trunc('day', LOCALTIMESTAMP)
+        GROUP BY 1, 2, 3, 4
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX ix_pad_day_product_type_context
+        ON recommender.product_analytics_daily
+        (day, external_product_id, interaction_type, recommendation_context)
+    """)
+
+
+def _copy_rows(source: str) -> None:
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text(f"SELECT COALESCE(MAX(id), 0) FROM {source}")).scalar()
+    copy = sa.text(f"""
+        INSERT INTO recommender.user_interactions
+        SELECT * FROM {source}
+        WHERE id BETWEEN :lo AND :hi
+    """)
+    for lo in range(1, max_id + 1, COPY_BATCH_SIZE):
+        bind.execute(copy, {"lo": lo, "hi": lo + COPY_BATCH_SIZE - 1})
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE recommender.user_interactions RENAME TO user_interactions_legacy")
+    op.execute("""
+        ALTER TABLE recommender.user_interactions_legacy
+        RENAME CONSTRAINT user_interactions_pkey TO user_interactions_legacy_pkey
+    """)
+    _drop_indexes()
+
+    # LIKE carries over the column types, NOT NULLs and defaults, including
+    # the id sequence, which moves to the new table so new ids carry on
+    op.execute("""
+        CREATE TABLE recommender.user_interactions (
+            LIKE recommender.user_interactions_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("""
+        ALTER SEQUENCE recommender.user_interactions_id_seq
+        OWNED BY recommender.user_interactions.id
+    """)
+    op.execute("""
+        CREATE TABLE recommender.user_interactions_default
+        PARTITION OF recommender.user_interactions DEFAULT
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION recommender.create_user_interactions_partition(month date)
+        RETURNS void AS $$
+        DECLARE
+            month_start date := CAST(date_trunc('month', month) AS date);
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS recommender.%I '
+                'PARTITION OF recommender.user_interactions FOR VALUES FROM (%L) TO (%L)',
+                'user_interactions_' || to_char(month_start, 'YYYY_MM'),
+                month_start,
+                CAST(month_start + INTERVAL '1 month' AS date)
+            );
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        SELECT recommender.create_user_interactions_partition(CAST(month AS date))
+        FROM generate_series(
+            date_trunc(
+                'month',
+                COALESCE(
+                    (SELECT MIN(created_at) FROM recommender.user_interactions_legacy),
+                    LOCALTIMESTAMP
+                )
+            ),
+            LOCALTIMESTAMP + INTERVAL '3 months',
+            INTERVAL '1 month'
+        ) AS month
+    """)
+
+    # Built while the parent is still empty; partitions created later inherit them
+    _create_indexes()
+
+    with op.get_context().autocommit_block():
+        _copy_rows("recommender.user_interactions_legacy")
+
+        # The analytics view reads the legacy table until it is swapped here
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS recommender.product_analytics_daily")
+        op.execute("DROP TABLE recommender.user_interactions_legacy")
+        _create_analytics_view()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE recommender.user_interactions RENAME TO user_interactions_partitioned")
+    op.execute("""
+        ALTER TABLE recommender.user_interactions_partitioned
+        RENAME CONSTRAINT user_interactions_pkey TO user_interactions_partitioned_pkey
+    """)
+    _drop_indexes()
+
+    op.execute("""
+        CREATE TABLE recommender.user_interactions (
+            LIKE recommender.user_interactions_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute("""
+        ALTER SEQUENCE recommender.user_interactions_id_seq
+        OWNED BY recommender.user_interactions.id
+    """)
+    _create_indexes()
+
+    with op.get_context().autocommit_block():
+        _copy_rows("recommender.user_interactions_partitioned")
+
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS recommender.product_analytics_daily")
+        op.execute("DROP TABLE recommender.user_interactions_partitioned")
+        op.execute(
+            "DROP FUNCTION IF EXISTS recommender.create_user_interactions_partition(date)"
+        )
+        _create_analytics_view()
@@ -0,0 +1,147 @@
+"""Store enum columns as VARCHAR with CHECK constraints.
+
+interaction_type, email_type and status used Postgres ENUM types. Adding a
+value to one needs ALTER TYPE ... ADD VALUE, which cannot run alongside other
+DDL in a transaction, and renaming or removing one means recreating the type
+and every column using it. As VARCHAR(32) with a CHECK constraint, the same
+change is a constraint swap. Stored values (the enum names) are unchanged.
+
+The analytics view selects interaction_type, so it is rebuilt around the
+change. So is the partial index ix_ui_product_type_purchase: its predicate
+is stored against the enum type, and Postgres would fail rebuilding it from
+that definition once the column is varchar.
+
+Revision ID: a6d2f8c4e9b3
+Revises: f4a7c1e8b2d6
+Create Date: 2026-10-15 17:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "a6d2f8c4e9b3"
+down_revision = "f4a7c1e8b2d6"
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, constraint, values)
+ENUM_COLUMNS = [
+    (
+        "user_interactions",
+        "interaction_type",
+        "interactiontype",
+        "ck_user_interactions_interaction_type",
+        [
+            "VIEW",
+            "CART_ADD",
+            "CART_REMOVE",
+            "PURCHASE",
+            "WISHLIST_ADD",
+            "SEARCH",
+            "RECOMMENDATION_CLICK",
+            "RECOMMENDATION_VIEW",
+        ],
+    ),
+    (
+        "email_campaigns",
+        "email_type",
+        "emailtype",
+        "ck_email_campaigns_email_type",
+        [
+            "CART_ABANDONMENT",
+            "NEW_PRODUCTS",
+            "WEEKLY_DIGEST",
+            "PERSONALIZED_PICKS",
+            "BACK_IN_STOCK",
+        ],
+    ),
+    (
+        "email_campaigns",
+        "status",
+        "emailstatus",
+        "ck_email_campaigns_status",
+        ["PENDING", "SENT", "DELIVERED", "OPENED", "CLICKED", "BOUNCED", "UNSUBSCRIBED"],
+    ),
+]
+
+
+def _values(values: list[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+HIGH_INTENT_TYPES = ["PURCHASE", "CART_ADD", "WISHLIST_ADD"]
+
+
+def _drop_high_intent_index() -> None:
+    op.execute("DROP INDEX IF EXISTS recommender.ix_ui_product_type_purchase")
+
+
+def _create_high_intent_index(literal_type: str) -> None:
+    # Same index as a3f1c8d92e47, with the predicate literals typed to match the column
+    types = ", ".join(f"CAST('{value}' AS {literal_type})" for value in HIGH_INTENT_TYPES)
+    op.execute(f"""
+        CREATE INDEX ix_ui_product_type_purchase
+        ON recommender.user_interactions (external_product_id, external_user_id)
+        WHERE interaction_type IN ({types})
+    """)
+
+
+def _drop_analytics_view() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS recommender.product_analytics_daily")
+
+
+def _create_analytics_view() -> None:
+    # Same definition as e7b1d3f9a6c2
+    op.execute("""
+        CREATE MATERIALIZED VIEW recommender.product_analytics_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            external_product_id,
+            interaction_type,
+            COALESCE(recommendation_context, '') AS recommendation_context,
+            COUNT(*) AS interaction_count
+        FROM recommender.user_interactions
+        WHERE external_product_id IS NOT NULL
+        AND created_at < date_trunc('day', LOCALTIMESTAMP)
+        GROUP BY 1, 2, 3, 4
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX ix_pad_day_product_type_context
+        ON recommender.product_analytics_daily
+        (day, external_product_id, interaction_type, recommendation_context)
+    """)
+
+
+def upgrade() -> None:
+    _drop_analytics_view()
+    _drop_high_intent_index()
+
+    for table, column, enum_type, constraint, values in ENUM_COLUMNS:
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ALTER COLUMN {column} TYPE varchar(32) USING CAST({column} AS text)
+        """)
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ADD CONSTRAINT {constraint} CHECK ({column} IN ({_values(values)}))
+        """)
+        op.execute(f"DROP TYPE IF EXISTS recommender.{enum_type}")
+
+    _create_high_intent_index("varchar")
+    _create_analytics_view()
+
+
+def downgrade() -> None:
+    _drop_analytics_view()
+    _drop_high_intent_index()
+
+    for table, column, enum_type, constraint, values in ENUM_COLUMNS:
+        op.execute(f"CREATE TYPE recommender.{enum_type} AS ENUM ({_values(values)})")
+        op.execute(f"ALTER TABLE recommender.{table} DROP CONSTRAINT IF EXISTS {constraint}")
+        op.execute(f"""
+            ALTER TABLE recommender.{table}
+            ALTER COLUMN {column} TYPE recommender.{enum_type}
+            USING CAST({column} AS recommender.{enum_type})
+        """)
+
+    _create_high_intent_index("recommender.interactiontype")
+    _create_analytics_view()
@@ -0,0 +1,52 @@
+"""Make the product_embeddings external_product_id index covering.
+
+Collaborative filtering and frequently-bought-together join product rows by
+external_product_id and read only the display columns. With those columns
+INCLUDEd in the unique index, the joins can be answered by index-only scans
+without visiting the heap. It also makes (external_product_id, is_active)
+redundant.
+
+The new index is built before the old one is dropped, so external_product_id
+stays unique throughout. VACUUM sets the visibility map that index-only scans
+depend on.
+
+Revision ID: c2b9e5f1d7a4
+Revises: a6d2f8c4e9b3
+Create Date: 2026-10-15 18:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "c2b9e5f1d7a4"
+down_revision = "a6d2f8c4e9b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_external_product_covering
+            ON recommender.product_embeddings (external_product_id)
+            INCLUDE (is_active, name, category, price_cents, popularity_score, stock)
+        """)
+        op.execute("""
+            DROP INDEX CONCURRENTLY IF EXISTS
+            recommender.ix_recommender_product_embeddings_external_product_id
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_pe_external_product_active")
+        op.execute("VACUUM (ANALYZE) recommender.product_embeddings")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS
+            ix_recommender_product_embeddings_external_product_id
+            ON recommender.product_embeddings (external_product_id)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_external_product_active
+            ON recommender.product_embeddings (external_product_id, is_active)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_pe_external_product_covering")
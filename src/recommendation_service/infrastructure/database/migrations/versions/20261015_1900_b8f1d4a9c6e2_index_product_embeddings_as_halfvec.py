@@ -0,0 +1,48 @@
+"""Build the product embedding HNSW index over half-precision vectors.
+
+An HNSW index over vector(384) stores 1.5 KB per product, so on a large
+catalogue the graph stops fitting in shared buffers. Indexing the embedding
+cast to halfvec(384) halves that, and distance computations read half the
+bytes, at a small recall cost. The similarity search fetches extra
+candidates from this index and re-ranks them by exact full-precision
+distance, so the column itself stays vector(384) and nothing needs a
+backfill.
+
+Queries must order by the same CAST(embedding AS halfvec(384)) expression
+for the planner to use the index. halfvec needs pgvector 0.7 or newer.
+
+Revision ID: b8f1d4a9c6e2
+Revises: c2b9e5f1d7a4
+Create Date: 2026-10-15 19:00:00.000000+00:00
+"""
+
+from alembic import op
+
+revision = "b8f1d4a9c6e2"
+down_revision = "c2b9e5f1d7a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_embedding_halfvec_hnsw
+            ON recommender.product_embeddings
+            USING hnsw ((CAST(embedding AS halfvec(384))) halfvec_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE is_active = true AND embedding IS NOT NULL
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_pe_embedding_hnsw")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pe_embedding_hnsw
+            ON recommender.product_embeddings
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE is_active = true AND embedding IS NOT NULL
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS recommender.ix_pe_embedding_halfvec_hnsw")
@@ -8,15 +8,8 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Any, Optional
 
-# Try to import pgvector, fall back to JSON if not available
-try:
-    from pgvector.sqlalchemy import Vector
-    HAS_PGVECTOR = True
-except ImportError:
-    HAS_PGVECTOR = False
-    Vector = None
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
-    JSON,
     Boolean,
     DateTime,
     Enum,
@@ -28,6 +21,7 @@ from sqlalchemy import (
     Text,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from recommendation_service.config import get_settings
@@ -49,6 +43,8 @@ class Base(DeclarativeBase):
 # =============================================================================
 # Enums
 # =============================================================================
+# Stored as VARCHAR with a CHECK constraint rather than as Postgres ENUM types,
+# so adding a value is a constraint swap instead of ALTER TYPE.
 
 
 class InteractionType(str, PyEnum):
@@ -100,9 +96,7 @@ class ProductEmbedding(Base):
     __tablename__ = "product_embeddings"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    external_product_id: Mapped[str] = mapped_column(
-        String(255), unique=True, nullable=False, index=True
-    )
+    external_product_id: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     category: Mapped[Optional[str]] = mapped_column(String(255))
     price_cents: Mapped[int] = mapped_column(Integer, default=0)
@@ -110,11 +104,7 @@ class ProductEmbedding(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Vector embedding (384 dimensions for all-MiniLM-L6-v2)
-    # Uses pgvector if available, otherwise stores as JSON
-    if HAS_PGVECTOR:
-        embedding: Mapped[Any] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
-    else:
-        embedding: Mapped[Any] = mapped_column(JSON, nullable=True)  # type: ignore
+    embedding: Mapped[Any] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
 
     # Popularity score (0-1, updated periodically)
     popularity_score: Mapped[float] = mapped_column(Float, default=0.0)
@@ -123,12 +113,28 @@ class ProductEmbedding(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
+    # Maintained on UPDATE by the recommender.update_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
     embedding_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     __table_args__ = (
+        # Covers the display columns read when joining on external_product_id,
+        # so those lookups can be index-only scans
+        Index(
+            "ix_pe_external_product_covering",
+            "external_product_id",
+            unique=True,
+            postgresql_include=[
+                "is_active",
+                "name",
+                "category",
+                "price_cents",
+                "popularity_score",
+                "stock",
+            ],
+        ),
         Index("ix_product_embeddings_category", "category"),
         Index("ix_product_embeddings_active", "is_active"),
         {"schema": SCHEMA},
@@ -154,14 +160,10 @@ class UserPreferenceEmbedding(Base):
     )
 
     # Vector embedding representing user preferences
-    # Uses pgvector if available, otherwise stores as JSON
-    if HAS_PGVECTOR:
-        embedding: Mapped[Any] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
-    else:
-        embedding: Mapped[Any] = mapped_column(JSON, nullable=True)  # type: ignore
+    embedding: Mapped[Any] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
 
     # Aggregated preferences (for transparency/debugging)
-    top_categories: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    top_categories: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
     avg_price_min: Mapped[Optional[float]] = mapped_column(Float)
     avg_price_max: Mapped[Optional[float]] = mapped_column(Float)
     interaction_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -170,8 +172,9 @@ class UserPreferenceEmbedding(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
+    # Maintained on UPDATE by the recommender.update_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
     last_active_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
@@ -188,6 +191,9 @@ class UserInteraction(Base):
 
     This supplements the e-commerce events table with recommendation-specific
     data like recommendation context, position, and attribution.
+
+    Range-partitioned by month on created_at, which is why the primary key
+    includes it. Partitions are created ahead of time by the sync worker.
     """
 
     __tablename__ = "user_interactions"
@@ -197,7 +203,15 @@ class UserInteraction(Base):
     external_product_id: Mapped[Optional[str]] = mapped_column(String(255), index=True)
 
     interaction_type: Mapped[InteractionType] = mapped_column(
-        Enum(InteractionType), nullable=False, index=True
+        Enum(
+            InteractionType,
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+            name="ck_user_interactions_interaction_type",
+        ),
+        nullable=False,
+        index=True,
     )
 
     # For search interactions
@@ -214,11 +228,11 @@ class UserInteraction(Base):
     session_id: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Additional data
-    extra_data: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    extra_data: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
 
-    # Timestamp
+    # Timestamp (append-only, so BRIN-indexed rather than B-tree; partition key)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), nullable=False, index=True
+        DateTime, server_default=func.now(), primary_key=True
     )
 
     __table_args__ = (
@@ -228,7 +242,13 @@ class UserInteraction(Base):
             "interaction_type",
             "created_at",
         ),
-        {"schema": SCHEMA},
+        Index(
+            "ix_ui_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"schema": SCHEMA, "postgresql_partition_by": "RANGE (created_at)"},
     )
 
 
@@ -247,7 +267,7 @@ class CartAbandonment(Base):
     external_cart_id: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Snapshot of cart at abandonment
-    cart_snapshot: Mapped[dict] = mapped_column(JSON, nullable=False)
+    cart_snapshot: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     # Reminder tracking
     abandonment_detected_at: Mapped[datetime] = mapped_column(
@@ -266,6 +286,12 @@ class CartAbandonment(Base):
             "external_user_id",
             "reminder_sent_at",
         ),
+        Index(
+            "ix_cart_abandonments_cart_snapshot",
+            "cart_snapshot",
+            postgresql_using="gin",
+            postgresql_ops={"cart_snapshot": "jsonb_path_ops"},
+        ),
         {"schema": SCHEMA},
     )
 
@@ -283,15 +309,32 @@ class EmailCampaign(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_user_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
 
-    email_type: Mapped[EmailType] = mapped_column(Enum(EmailType), nullable=False)
+    email_type: Mapped[EmailType] = mapped_column(
+        Enum(
+            EmailType,
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+            name="ck_email_campaigns_email_type",
+        ),
+        nullable=False,
+    )
     subject: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Recommended products included
-    recommended_product_ids: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    recommended_product_ids: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
 
     # Status tracking
     status: Mapped[EmailStatus] = mapped_column(
-        Enum(EmailStatus), default=EmailStatus.PENDING, index=True
+        Enum(
+            EmailStatus,
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+            name="ck_email_campaigns_status",
+        ),
+        default=EmailStatus.PENDING,
+        index=True,
     )
 
     # Timestamps
@@ -335,8 +378,9 @@ class UserEmailPreference(Base):
     frequency_cap_per_week: Mapped[int] = mapped_column(Integer, default=3)
 
     # Timestamps
+    # Maintained on UPDATE by the recommender.update_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     __table_args__ = ({"schema": SCHEMA},)
@@ -389,8 +433,9 @@ class SyncStatus(Base):
     records_synced: Mapped[int] = mapped_column(Integer, default=0)
     status: Mapped[str] = mapped_column(String(50), default="idle")  # idle, running, error
     error_message: Mapped[Optional[str]] = mapped_column(Text)
+    # Maintained on UPDATE by the recommender.update_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     __table_args__ = ({"schema": SCHEMA},)
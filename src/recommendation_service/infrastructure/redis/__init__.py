@@ -11,6 +11,7 @@ from recommendation_service.config import get_settings
 logger = structlog.get_logger()
 
 _redis_client: aioredis.Redis | None = None
+_cache_service: "CacheService | None" = None
 
 
 async def get_redis_client() -> aioredis.Redis | None:
@@ -19,13 +20,20 @@ async def get_redis_client() -> aioredis.Redis | None:
     if _redis_client is None:
         settings = get_settings()
         try:
-            _redis_client = aioredis.from_url(
+            # Bounded and blocking: a burst waits for a pooled connection instead
+            # of opening an unbounded number of sockets to Redis
+            pool = aioredis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                timeout=2,
                 decode_responses=False,
                 socket_connect_timeout=2,
                 socket_timeout=2,
+                socket_keepalive=True,
+                health_check_interval=30,
                 retry_on_timeout=True,
             )
+            _redis_client = aioredis.Redis(connection_pool=pool)
             await _redis_client.ping()
             logger.info("Redis connection established")
         except Exception as e:
@@ -36,10 +44,12 @@ async def get_redis_client() -> aioredis.Redis | None:
 
 async def close_redis() -> None:
     """Close the Redis connection on shutdown."""
-    global _redis_client
+    global _redis_client, _cache_service
     if _redis_client:
-        await _redis_client.close()
+        # Redis() doesn't own an explicitly passed pool, so disconnect it too
+        await _redis_client.aclose(close_connection_pool=True)
         _redis_client = None
+    _cache_service = None
 
 
 class CacheService:
@@ -75,6 +85,14 @@ class CacheService:
         except Exception as e:
             logger.warning("Cache delete failed", key=key, error=str(e))
 
+    async def delete_many(self, *keys: str) -> None:
+        if not self.client or not keys:
+            return
+        try:
+            await self.client.delete(*keys)
+        except Exception as e:
+            logger.warning("Cache delete failed", keys=keys, error=str(e))
+
     async def health_check(self) -> bool:
         if not self.client:
             return False
@@ -82,3 +100,18 @@ class CacheService:
             return await self.client.ping()
         except Exception:
             return False
+
+
+async def get_cache() -> CacheService:
+    """Get the shared CacheService (FastAPI dependency).
+
+    Only a connected service is kept; while Redis is unavailable a no-op
+    service is returned so the next request retries the connection.
+    """
+    global _cache_service
+    if _cache_service is None:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return CacheService(None)
+        _cache_service = CacheService(redis_client)
+    return _cache_service
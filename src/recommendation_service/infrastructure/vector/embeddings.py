@@ -38,6 +38,17 @@ class EmbeddingService:
                 logger.info("Local embeddings disabled, using mock embeddings")
                 self._model = MockEmbeddingModel(self.settings.embedding_dimension)
                 return self._model
+            if self.model_name == self.settings.embedding_model:
+                # Reuse the process-wide model rather than loading a second copy
+                from recommendation_service.services.embedding import get_embedding_model
+
+                self._model = get_embedding_model()
+                if self._model is None:
+                    logger.warning(
+                        "sentence-transformers not installed, using mock embeddings"
+                    )
+                    self._model = MockEmbeddingModel(self.settings.embedding_dimension)
+                return self._model
             try:
                 from sentence_transformers import SentenceTransformer
 
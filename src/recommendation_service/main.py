@@ -1,17 +1,21 @@
 """FastAPI application entry point."""
 
-import structlog
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import AsyncGenerator
 
+import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
 
+from recommendation_service.api.v1.benchmarks import start_cpu_sampler
+from recommendation_service.api.v1.recommendations import start_search_tracker
 from recommendation_service.api.v1.router import api_router
 from recommendation_service.config import get_settings
+from recommendation_service.infrastructure.database.connection import close_database
 from recommendation_service.infrastructure.redis import close_redis
 from recommendation_service.middleware.timing import TimingMiddleware
 
@@ -54,9 +58,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     else:
         logger.info("Local embeddings disabled, skipping model pre-warm")
 
+    cpu_sampler = start_cpu_sampler()
+    search_tracker = start_search_tracker()
+
     yield
 
+    cpu_sampler.cancel()
+    search_tracker.cancel()
+    with suppress(asyncio.CancelledError):
+        await search_tracker
     await close_redis()
+    await close_database()
     logger.info("Shutting down Reemio Recommender Service")
 
 
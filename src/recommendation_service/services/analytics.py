@@ -0,0 +1,276 @@
+"""Business analytics rollups computed in Postgres."""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from recommendation_service.infrastructure.redis import CacheService
+
+# Change (in percent) beyond which a product counts as rising or declining
+TREND_THRESHOLD_PERCENT = 20
+
+# Dashboards poll these rollups; a few minutes of staleness is acceptable
+ANALYTICS_CACHE_TTL_SECONDS = 300
+
+
+def period_bounds(start: date, end: date) -> tuple[datetime, datetime, datetime]:
+    """Return (previous_start, current_start, current_end) for an inclusive date range.
+
+    The previous period has the same length and ends where the current one starts.
+    Bounds are naive to match the recommender schema's timestamp columns.
+    """
+    current_start = datetime.combine(start, time.min)
+    current_end = datetime.combine(end + timedelta(days=1), time.min)
+    previous_start = current_start - (current_end - current_start)
+    return previous_start, current_start, current_end
+
+
+def _percent(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator * 100, 2) if denominator else 0.0
+
+
+def _daily_counts_ctes(context_filter: bool = False) -> str:
+    """CTEs yielding daily_counts(day, external_product_id, interaction_type, interaction_count).
+
+    Completed days come from the product_analytics_daily materialized view; only
+    interactions newer than its last aggregated day are counted from the raw table.
+    Expects :interaction_types, :window_start, :window_end (and :context if filtered).
+    """
+    view_context = "AND d.recommendation_context = :context" if context_filter else ""
+    raw_context = "AND ui.recommendation_context = :context" if context_filter else ""
+    return f"""
+        aggregated AS (
+            SELECT COALESCE(MAX(day) + INTERVAL '1 day', :window_start) AS live_from
+            FROM recommender.product_analytics_daily
+        ),
+        daily_counts AS (
+            SELECT d.day, d.external_product_id, d.interaction_type, d.interaction_count
+            FROM recommender.product_analytics_daily d
+            WHERE d.interaction_type = ANY(CAST(:interaction_types AS text[]))
+            AND d.day >= :window_start AND d.day < :window_end
+            {view_context}
+            UNION ALL
+            SELECT
+                date_trunc('day', ui.created_at), ui.external_product_id, ui.interaction_type,
+                COUNT(*)
+            FROM recommender.user_interactions ui, aggregated a
+            WHERE ui.interaction_type = ANY(CAST(:interaction_types AS text[]))
+            AND ui.external_product_id IS NOT NULL
+            AND ui.created_at >= GREATEST(a.live_from, :window_start)
+            AND ui.created_at < :window_end
+            {raw_context}
+            GROUP BY 1, 2, 3
+        )
+    """
+
+
+class AnalyticsService:
+    """Aggregates interaction data for the analytics endpoints.
+
+    Counting, ranking and trend comparison all happen in SQL so each endpoint
+    is a single round-trip returning rows already in response shape. Product
+    counts are read from the daily rollup rather than scanning every interaction.
+    """
+
+    def __init__(self, session: AsyncSession, cache: CacheService | None = None):
+        self.session = session
+        self.cache = cache
+
+    async def get_top_products(
+        self,
+        interaction_type: str,
+        start: date,
+        end: date,
+        limit: int = 20,
+        category: str | None = None,
+        context: str | None = None,
+    ) -> dict[str, Any]:
+        """Rank products by interaction count, with trend against the previous period."""
+        cache_key = f"analytics:top:{interaction_type}:{start}:{end}:{limit}:{category}:{context}"
+        if self.cache:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        previous_start, current_start, current_end = period_bounds(start, end)
+        params: dict[str, Any] = {
+            "interaction_types": [interaction_type],
+            "window_start": previous_start,
+            "window_end": current_end,
+            "current_start": current_start,
+            "threshold": 1 + TREND_THRESHOLD_PERCENT / 100,
+            "floor": 1 - TREND_THRESHOLD_PERCENT / 100,
+            "limit": limit,
+        }
+
+        if context:
+            params["context"] = context
+        product_filters = ""
+        if category:
+            product_filters += " AND pe.category = :category"
+            params["category"] = category
+
+        query = text(f"""
+            WITH {_daily_counts_ctes(context_filter=bool(context))},
+            counts AS (
+                SELECT
+                    external_product_id,
+                    SUM(interaction_count) FILTER (WHERE day >= :current_start)::bigint
+                        AS current_count,
+                    COALESCE(SUM(interaction_count) FILTER (WHERE day < :current_start), 0)::bigint
+                        AS previous_count
+                FROM daily_counts
+                GROUP BY external_product_id
+                HAVING SUM(interaction_count) FILTER (WHERE day >= :current_start) > 0
+            )
+            SELECT
+                pe.id, pe.external_product_id, pe.name, pe.category,
+                c.current_count,
+                CASE
+                    WHEN c.previous_count = 0 THEN 'new'
+                    WHEN c.current_count > c.previous_count * CAST(:threshold AS numeric) THEN 'rising'
+                    WHEN c.current_count < c.previous_count * CAST(:floor AS numeric) THEN 'declining'
+                    ELSE 'stable'
+                END AS trend,
+                ROUND(
+                    (c.current_count - c.previous_count) * 100.0 / NULLIF(c.previous_count, 0), 2
+                ) AS change_percent,
+                COUNT(*) OVER () AS total_count
+            FROM counts c
+            JOIN recommender.product_embeddings pe ON pe.external_product_id = c.external_product_id
+            WHERE true {product_filters}
+            ORDER BY c.current_count DESC, pe.external_product_id
+            LIMIT :limit
+        """)
+
+        result = await self.session.execute(query, params)
+        rows = result.fetchall()
+
+        top_products = {
+            "products": [
+                {
+                    "product_id": str(r.id),
+                    "external_product_id": r.external_product_id,
+                    "name": r.name,
+                    "category": r.category or "Unknown",
+                    "count": r.current_count,
+                    "trend": r.trend,
+                    "change_percent": (
+                        float(r.change_percent) if r.change_percent is not None else None
+                    ),
+                }
+                for r in rows
+            ],
+            "total_count": rows[0].total_count if rows else 0,
+        }
+
+        if self.cache:
+            await self.cache.set(cache_key, top_products, ttl_seconds=ANALYTICS_CACHE_TTL_SECONDS)
+
+        return top_products
+
+    async def get_conversion_funnel(self, start: date, end: date) -> dict[str, Any]:
+        """Count distinct users reaching each funnel stage."""
+        cache_key = f"analytics:funnel:{start}:{end}"
+        if self.cache:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        _, current_start, current_end = period_bounds(start, end)
+        query = text("""
+            SELECT
+                COUNT(DISTINCT external_user_id) AS total_users,
+                COUNT(DISTINCT external_user_id) FILTER (WHERE interaction_type = 'VIEW') AS viewed,
+                COUNT(DISTINCT external_user_id) FILTER (WHERE interaction_type = 'CART_ADD') AS added_to_cart,
+                COUNT(DISTINCT external_user_id) FILTER (WHERE interaction_type = 'PURCHASE') AS purchased
+            FROM recommender.user_interactions
+            WHERE created_at >= :current_start AND created_at < :current_end
+        """)
+
+        result = await self.session.execute(
+            query, {"current_start": current_start, "current_end": current_end}
+        )
+        row = result.one()
+
+        funnel = {
+            "total_users": row.total_users,
+            "viewed": row.viewed,
+            "added_to_cart": row.added_to_cart,
+            "purchased": row.purchased,
+            "view_to_cart_percent": _percent(row.added_to_cart, row.viewed),
+            "cart_to_purchase_percent": _percent(row.purchased, row.added_to_cart),
+            "view_to_purchase_percent": _percent(row.purchased, row.viewed),
+        }
+
+        if self.cache:
+            await self.cache.set(cache_key, funnel, ttl_seconds=ANALYTICS_CACHE_TTL_SECONDS)
+
+        return funnel
+
+    async def get_category_performance(self, start: date, end: date) -> list[dict[str, Any]]:
+        """Views, purchases and purchase revenue per catalog category."""
+        cache_key = f"analytics:categories:{start}:{end}"
+        if self.cache:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        _, current_start, current_end = period_bounds(start, end)
+        query = text(f"""
+            WITH {_daily_counts_ctes()},
+            product_counts AS (
+                SELECT
+                    external_product_id,
+                    SUM(interaction_count) FILTER (WHERE interaction_type = 'VIEW') AS views,
+                    SUM(interaction_count) FILTER (WHERE interaction_type = 'PURCHASE') AS purchases
+                FROM daily_counts
+                GROUP BY external_product_id
+            ),
+            totals AS (
+                SELECT
+                    COALESCE(pe.category, 'Unknown') AS category,
+                    COUNT(*) AS product_count,
+                    COALESCE(SUM(pc.views), 0)::bigint AS total_views,
+                    COALESCE(SUM(pc.purchases), 0)::bigint AS total_purchases,
+                    COALESCE(SUM(pc.purchases * pe.price_cents), 0)::bigint AS revenue_cents
+                FROM recommender.product_embeddings pe
+                LEFT JOIN product_counts pc ON pc.external_product_id = pe.external_product_id
+                WHERE pe.is_active = true
+                GROUP BY 1
+            )
+            SELECT
+                category, product_count, total_views, total_purchases,
+                ROUND(total_purchases * 100.0 / NULLIF(total_views, 0), 2) AS conversion_rate_percent,
+                revenue_cents
+            FROM totals
+            ORDER BY total_views DESC, category
+        """)
+
+        result = await self.session.execute(
+            query,
+            {
+                "interaction_types": ["VIEW", "PURCHASE"],
+                "window_start": current_start,
+                "window_end": current_end,
+            },
+        )
+
+        categories = [
+            {
+                "category": r.category,
+                "product_count": r.product_count,
+                "total_views": r.total_views,
+                "total_purchases": r.total_purchases,
+                "conversion_rate_percent": float(r.conversion_rate_percent or 0),
+                "revenue": r.revenue_cents / 100,
+            }
+            for r in result.fetchall()
+        ]
+
+        if self.cache:
+            await self.cache.set(cache_key, categories, ttl_seconds=ANALYTICS_CACHE_TTL_SECONDS)
+
+        return categories
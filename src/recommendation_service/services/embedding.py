@@ -3,20 +3,25 @@
 Uses sentence-transformers to generate embeddings for products and user preferences.
 """
 
+import asyncio
+import threading
 from typing import Any
 
+import numpy as np
 import orjson
-
 import structlog
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from recommendation_service.config import get_settings
 
 logger = structlog.get_logger()
 
-# Lazy-loaded model to avoid loading on import
+# Lazy-loaded model to avoid loading on import; shared by every EmbeddingService
 _embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+ENCODE_BATCH_SIZE = 64
 
 
 def get_embedding_model():
@@ -27,7 +32,13 @@ def get_embedding_model():
     if settings.disable_local_embeddings:
         return None
 
-    if _embedding_model is None:
+    if _embedding_model is not None:
+        return _embedding_model
+
+    # Encoding may run in worker threads; make sure only one of them loads the model
+    with _embedding_model_lock:
+        if _embedding_model is not None:
+            return _embedding_model
         try:
             from sentence_transformers import SentenceTransformer
 
@@ -68,7 +79,9 @@ class EmbeddingService:
             return None
 
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self.model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=True
+            )
             return embedding.tolist()
         except Exception as e:
             logger.error("Error generating embedding", error=str(e))
@@ -76,16 +89,28 @@ class EmbeddingService:
 
     def generate_embeddings_batch(self, texts: list[str]) -> list[list[float] | None]:
         """Generate embeddings for multiple texts."""
+        embeddings = self._encode_batch(texts)
+        if embeddings is None:
+            return [None] * len(texts)
+        return embeddings.tolist()
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray | None:
+        """Encode texts into a float32 matrix, or None if encoding is unavailable."""
         if self.model is None:
             logger.warning("Embedding model not available")
-            return [None] * len(texts)
+            return None
 
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
-            return [emb.tolist() for emb in embeddings]
+            embeddings = self.model.encode(
+                texts,
+                batch_size=ENCODE_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+            return np.asarray(embeddings, dtype=np.float32)
         except Exception as e:
             logger.error("Error generating batch embeddings", error=str(e))
-            return [None] * len(texts)
+            return None
 
     def create_product_text(self, product: dict[str, Any]) -> str:
         """Create text representation of a product for embedding."""
@@ -126,10 +151,14 @@ class EmbeddingService:
     ) -> list[float] | None:
         """Generate embedding for a product."""
         text = self.create_product_text(product)
-        return self.generate_embedding(text)
+        return await asyncio.to_thread(self.generate_embedding, text)
 
     async def update_product_embeddings(
-        self, batch_size: int = 50, only_missing: bool = True
+        self,
+        batch_size: int = 32,
+        only_missing: bool = True,
+        concurrency: int = 1,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> dict[str, int]:
         """
         Generate embeddings for products in the database.
@@ -137,91 +166,111 @@ class EmbeddingService:
         Args:
             batch_size: Number of products to process per batch
             only_missing: If True, only process products without embeddings
+            concurrency: Maximum number of batch writes in flight at once
+            session_factory: Gives each concurrent write its own session; required
+                when concurrency > 1 since one session cannot run statements in parallel
 
         Returns:
             Summary of the operation
         """
         if self.session is None:
             raise ValueError("Session required for database operations")
-
-        # Get products needing embeddings
-        if only_missing:
-            query = text("""
-                SELECT id, external_product_id, name, category, price_cents
-                FROM recommender.product_embeddings
-                WHERE embedding IS NULL AND is_active = true
-                ORDER BY id
-                LIMIT :limit
-            """)
-        else:
-            query = text("""
-                SELECT id, external_product_id, name, category, price_cents
-                FROM recommender.product_embeddings
-                WHERE is_active = true
-                ORDER BY id
-                LIMIT :limit
-            """)
+        if concurrency > 1 and session_factory is None:
+            raise ValueError("session_factory required when concurrency > 1")
+
+        # Keyset pagination: each page starts after the last id seen, so reading the
+        # next batch never waits for the previous batch's writes to commit
+        missing_filter = "AND embedding IS NULL" if only_missing else ""
+        query = text(f"""
+            SELECT id, external_product_id, name, category, price_cents
+            FROM recommender.product_embeddings
+            WHERE is_active = true AND id > :last_id {missing_filter}
+            ORDER BY id
+            LIMIT :limit
+        """)
+        # Bound as vector text input ("[x, y, ...]"), which orjson produces directly
+        update_query = text("""
+            UPDATE recommender.product_embeddings
+            SET embedding = :embedding,
+                embedding_updated_at = NOW()
+            WHERE id = :id
+        """)
 
         updated = 0
         errors = 0
-
-        while True:
-            result = await self.session.execute(query, {"limit": batch_size})
-            products = result.fetchall()
-
-            if not products:
-                break
-
-            # Prepare texts for batch embedding
-            texts = []
-            product_ids = []
-            for p in products:
-                product_dict = {
-                    "name": p.name,
-                    "category": p.category,
-                    "price_cents": p.price_cents,
-                }
-                texts.append(self.create_product_text(product_dict))
-                product_ids.append(p.id)
-
-            # Generate embeddings
-            embeddings = self.generate_embeddings_batch(texts)
-
-            # Update database
-            for pid, emb in zip(product_ids, embeddings):
-                if emb is not None:
-                    try:
-                        # Store as JSON since we don't have pgvector
-                        update_query = text("""
-                            UPDATE recommender.product_embeddings
-                            SET embedding = :embedding,
-                                embedding_updated_at = NOW()
-                            WHERE id = :id
-                        """)
-                        await self.session.execute(
-                            update_query,
-                            {"id": pid, "embedding": orjson.dumps(emb).decode()},
-                        )
-                        updated += 1
-                    except Exception as e:
-                        logger.error("Error updating embedding", id=pid, error=str(e))
-                        errors += 1
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def write_batch(params: list[dict[str, Any]]) -> None:
+            nonlocal updated, errors
+            try:
+                if session_factory is None:
+                    await self.session.execute(update_query, params)
+                    await self.session.commit()
                 else:
-                    errors += 1
-
-            await self.session.commit()
+                    async with session_factory() as session:
+                        await session.execute(update_query, params)
+                        await session.commit()
+                updated += len(params)
+            except Exception as e:
+                logger.error("Error updating embeddings batch", size=len(params), error=str(e))
+                errors += len(params)
+            finally:
+                semaphore.release()
             logger.info("Batch embeddings updated", updated=updated, errors=errors)
 
-            # If we got fewer than batch_size, we're done
-            if len(products) < batch_size:
-                break
+        last_id = 0
+        async with asyncio.TaskGroup() as tg:
+            while True:
+                result = await self.session.execute(
+                    query, {"last_id": last_id, "limit": batch_size}
+                )
+                products = result.fetchall()
+
+                if not products:
+                    break
+                last_id = products[-1].id
+
+                texts = [
+                    self.create_product_text(
+                        {"name": p.name, "category": p.category, "price_cents": p.price_cents}
+                    )
+                    for p in products
+                ]
+
+                # Encode off the event loop so in-flight writes keep progressing
+                embeddings = await asyncio.to_thread(self._encode_batch, texts)
+
+                # Serializing the float32 rows directly writes each component's shortest
+                # float32 repr, roughly 40% fewer bytes than going through Python floats
+                params = []
+                if embeddings is None:
+                    errors += len(products)
+                else:
+                    params = [
+                        {
+                            "id": p.id,
+                            "embedding": orjson.dumps(
+                                emb, option=orjson.OPT_SERIALIZE_NUMPY
+                            ).decode(),
+                        }
+                        for p, emb in zip(products, embeddings, strict=True)
+                    ]
+
+                if params:
+                    await semaphore.acquire()
+                    if session_factory is None:
+                        await write_batch(params)
+                    else:
+                        tg.create_task(write_batch(params))
+
+                # If we got fewer than batch_size, we're done
+                if len(products) < batch_size:
+                    break
 
         return {"updated": updated, "errors": errors}
 
     def cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity between two vectors using numpy."""
-        import numpy as np
-
         a = np.array(vec1, dtype=np.float32)
         b = np.array(vec2, dtype=np.float32)
         norm_a = np.linalg.norm(a)
@@ -150,7 +150,7 @@ class RecommendationEvaluator:
         return {
             "comparison": results,
             "best_strategy": max(results.keys(), key=lambda x: results[x]["ndcg_at_k"]),
-            "evaluated_at": datetime.now().isoformat(),
+            "evaluated_at": datetime.now(),
         }
 
     async def get_coverage_report(self) -> dict[str, Any]:
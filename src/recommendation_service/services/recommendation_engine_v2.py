@@ -12,6 +12,7 @@ import structlog
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from recommendation_service.infrastructure.database.connection import HNSW_EF_SEARCH
 from recommendation_service.infrastructure.redis import CacheService
 from recommendation_service.services.embedding import EmbeddingService
 from recommendation_service.services.reranker import RerankerService
@@ -26,6 +27,10 @@ class HybridRecommendationEngine:
     COLLABORATIVE_WEIGHT = 0.3
     POPULARITY_WEIGHT = 0.2
 
+    # Half-precision ANN candidates fetched per result, re-ranked at full precision.
+    # One HNSW scan yields at most hnsw.ef_search rows, which caps the candidates.
+    ANN_CANDIDATE_MULTIPLIER = 4
+
     def __init__(
         self,
         session: AsyncSession,
@@ -44,7 +49,7 @@ class HybridRecommendationEngine:
         diversity_limit_per_category: int = 3,
     ) -> dict[str, Any]:
         """Get homepage recommendations - personalized if user data exists, otherwise popular."""
-        request_id = str(uuid4())
+        request_id = uuid4().hex
 
         candidates = []
         has_user_data = False
@@ -86,7 +91,7 @@ class HybridRecommendationEngine:
                         user_categories=user_prefs.get("top_categories"),
                         context="homepage recommendations",
                     )
-                    candidates = self._rerank_and_normalize(query, candidates, top_k=limit * 2)
+                    candidates = await self._rerank_and_normalize(query, candidates, top_k=limit * 2)
         else:
             candidates = self._normalize_popularity_scores(candidates)
 
@@ -103,7 +108,7 @@ class HybridRecommendationEngine:
             "request_id": request_id,
             "context": "homepage",
             "user_id": user_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
 
     async def get_similar_products(
@@ -113,7 +118,7 @@ class HybridRecommendationEngine:
         limit: int = 8,
     ) -> dict[str, Any]:
         """Get products similar to a given product."""
-        request_id = str(uuid4())
+        request_id = uuid4().hex
 
         source_product = await self._get_product_by_external_id(product_id)
         if not source_product:
@@ -142,7 +147,7 @@ class HybridRecommendationEngine:
 
         if self.reranker and source_product.get("name"):
             query = f"{source_product['name']} {source_product.get('category', '')}"
-            candidates = self._rerank_and_normalize(query, candidates, top_k=limit * 2)
+            candidates = await self._rerank_and_normalize(query, candidates, top_k=limit * 2)
 
         candidates = self._apply_business_rules(candidates)
         candidates = candidates[:limit]
@@ -156,7 +161,7 @@ class HybridRecommendationEngine:
             "request_id": request_id,
             "context": "product_page",
             "user_id": user_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
 
     async def get_cart_recommendations(
@@ -166,17 +171,15 @@ class HybridRecommendationEngine:
         limit: int = 6,
     ) -> dict[str, Any]:
         """Get recommendations based on cart contents."""
-        request_id = str(uuid4())
+        request_id = uuid4().hex
 
         cart_embeddings = []
         cart_categories = set()
-        for pid in cart_product_ids:
-            product = await self._get_product_by_external_id(pid)
-            if product:
-                if product.get("embedding"):
-                    cart_embeddings.append(product["embedding"])
-                if product.get("category"):
-                    cart_categories.add(product["category"])
+        for product in await self._get_cart_products(cart_product_ids):
+            if product["embedding"]:
+                cart_embeddings.append(product["embedding"])
+            if product["category"]:
+                cart_categories.add(product["category"])
 
         candidates = []
         if cart_embeddings:
@@ -194,7 +197,7 @@ class HybridRecommendationEngine:
 
         if self.reranker and cart_categories:
             query = f"Products complementary to {', '.join(list(cart_categories)[:3])}"
-            candidates = self._rerank_and_normalize(query, candidates, top_k=limit * 2)
+            candidates = await self._rerank_and_normalize(query, candidates, top_k=limit * 2)
 
         candidates = self._apply_business_rules(candidates)
         candidates = candidates[:limit]
@@ -208,7 +211,7 @@ class HybridRecommendationEngine:
             "request_id": request_id,
             "context": "cart",
             "user_id": user_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
 
     async def get_frequently_bought_together(
@@ -217,7 +220,7 @@ class HybridRecommendationEngine:
         limit: int = 4,
     ) -> dict[str, Any]:
         """Get products frequently bought together with the given product."""
-        request_id = str(uuid4())
+        request_id = uuid4().hex
 
         candidates = await self._get_co_purchased_products(product_id, limit=limit * 2)
 
@@ -246,7 +249,7 @@ class HybridRecommendationEngine:
             "request_id": request_id,
             "context": "frequently_bought_together",
             "user_id": None,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
 
     def _deduplicate_candidates(
@@ -321,14 +324,15 @@ class HybridRecommendationEngine:
         candidates.sort(key=lambda x: x.get("score", 0), reverse=True)
         return candidates
 
-    def _rerank_and_normalize(
+    async def _rerank_and_normalize(
         self, query: str, candidates: list[dict[str, Any]], top_k: int
     ) -> list[dict[str, Any]]:
         """Rerank candidates and normalize scores to 0-1."""
         if not self.reranker or not candidates:
             return candidates
 
-        reranked = self.reranker.rerank(query, candidates, top_k=top_k)
+        # The Pinecone client is blocking HTTP; keep it off the event loop
+        reranked = await asyncio.to_thread(self.reranker.rerank, query, candidates, top_k=top_k)
 
         if reranked:
             scores = [c.get("score", 0) for c in reranked]
@@ -542,74 +546,81 @@ class HybridRecommendationEngine:
             }
         return None
 
-    async def _search_similar_products(
-        self, query_embedding: list[float], limit: int = 12, exclude_ids: list[str] | None = None
-    ) -> list[dict[str, Any]]:
-        """Search for products similar to query embedding using vectorized cosine similarity."""
-        exclude_ids = exclude_ids or []
-        candidate_limit = min(limit * 10, 200)
-
+    async def _get_cart_products(self, external_ids: list[str]) -> list[dict[str, Any]]:
+        """Get embedding and category for several products in one query."""
         query = text("""
-            SELECT external_product_id, name, category, price_cents,
-                   embedding, popularity_score, stock
+            SELECT embedding, category
             FROM recommender.product_embeddings
-            WHERE is_active = true AND embedding IS NOT NULL
-            AND external_product_id != ALL(:exclude_ids)
-            ORDER BY popularity_score DESC NULLS LAST
-            LIMIT :candidate_limit
+            WHERE external_product_id = ANY(:external_ids)
         """)
-        result = await self.session.execute(
-            query, {"exclude_ids": exclude_ids, "candidate_limit": candidate_limit}
-        )
-        rows = result.fetchall()
+        result = await self.session.execute(query, {"external_ids": external_ids})
 
-        # Parse embeddings and filter valid candidates
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = np.linalg.norm(query_vec)
-        if query_norm == 0:
-            return []
-
-        candidates = []
-        embeddings_list = []
-        for row in rows:
+        products = []
+        for row in result.fetchall():
             embedding = row.embedding
             if isinstance(embedding, str):
                 embedding = orjson.loads(embedding)
-            if isinstance(embedding, list) and embedding:
-                candidates.append(row)
-                embeddings_list.append(embedding)
+            products.append({"embedding": embedding, "category": row.category or "Unknown"})
+        return products
 
-        if not embeddings_list:
+    async def _search_similar_products(
+        self, query_embedding: list[float], limit: int = 12, exclude_ids: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Nearest active products by cosine distance, served by the HNSW index.
+
+        Candidates come from the half-precision HNSW index, which only reads
+        ids; they are then re-ranked by exact full-precision distance, and the
+        display columns come from the same heap rows.
+        """
+        if not any(query_embedding):
             return []
 
-        # Batch cosine similarity: (N, 384) @ (384,) / (norms * query_norm)
-        emb_matrix = np.array(embeddings_list, dtype=np.float32)
-        norms = np.linalg.norm(emb_matrix, axis=1)
-        valid_mask = norms > 0
-        similarities = np.zeros(len(embeddings_list), dtype=np.float32)
-        similarities[valid_mask] = (
-            emb_matrix[valid_mask] @ query_vec / (norms[valid_mask] * query_norm)
+        candidates = min(limit * self.ANN_CANDIDATE_MULTIPLIER, HNSW_EF_SEARCH)
+        query = text("""
+            WITH candidates AS (
+                SELECT id
+                FROM recommender.product_embeddings
+                WHERE is_active = true AND embedding IS NOT NULL
+                AND external_product_id != ALL(:exclude_ids)
+                ORDER BY CAST(embedding AS halfvec(384))
+                    <=> CAST(:query_embedding AS halfvec(384))
+                LIMIT :candidates
+            )
+            SELECT pe.external_product_id, pe.name, pe.category, pe.price_cents,
+                   pe.popularity_score, pe.stock,
+                   pe.embedding <=> CAST(:query_embedding AS vector) AS distance
+            FROM candidates c
+            JOIN recommender.product_embeddings pe ON pe.id = c.id
+            ORDER BY distance
+            LIMIT :limit
+        """)
+        result = await self.session.execute(
+            query,
+            {
+                "query_embedding": orjson.dumps(
+                    query_embedding, option=orjson.OPT_SERIALIZE_NUMPY
+                ).decode(),
+                "exclude_ids": exclude_ids or [],
+                "candidates": max(candidates, limit),
+                "limit": limit,
+            },
         )
 
-        # Build scored list from valid results
-        scored = []
-        for i, row in enumerate(candidates):
-            if valid_mask[i]:
-                scored.append({
-                    "product_id": str(row.external_product_id),
-                    "external_product_id": row.external_product_id,
-                    "name": row.name,
-                    "category": row.category or "Unknown",
-                    "price": row.price_cents / 100,
-                    "stock": row.stock,
-                    "image_url": None,
-                    "score": float(similarities[i]),
-                    "popularity_score": row.popularity_score,
-                    "signal": "content",
-                })
-
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:limit]
+        return [
+            {
+                "product_id": str(row.external_product_id),
+                "external_product_id": row.external_product_id,
+                "name": row.name,
+                "category": row.category or "Unknown",
+                "price": row.price_cents / 100,
+                "stock": row.stock,
+                "image_url": None,
+                "score": 1.0 - row.distance,
+                "popularity_score": row.popularity_score,
+                "signal": "content",
+            }
+            for row in result.fetchall()
+        ]
 
     async def _get_popular_products(self, limit: int = 12) -> list[dict[str, Any]]:
         """Get popular products as fallback (cached for 5 minutes)."""
@@ -720,7 +731,7 @@ class HybridRecommendationEngine:
         """
         from recommendation_service.services.search import SearchService
 
-        request_id = str(uuid4())
+        request_id = uuid4().hex
         search_service = SearchService(self.session)
 
         # Get user preferences for personalization (cached, ~5ms with Redis)
@@ -741,12 +752,13 @@ class HybridRecommendationEngine:
             return self._empty_response(request_id, "search", user_id)
 
         # Stage 2: Blend with embedding cosine similarity
-        query_embedding = self.embedding_service.generate_embedding(query)
+        # Model inference is CPU-bound; run it in a worker thread
+        query_embedding = await asyncio.to_thread(self.embedding_service.generate_embedding, query)
         candidates = search_service.blend_with_embeddings(candidates, query_embedding)
 
         # Stage 3: Optional Pinecone reranking
         if self.reranker and len(candidates) > 1:
-            candidates = self._rerank_and_normalize(query, candidates, top_k=limit * 2)
+            candidates = await self._rerank_and_normalize(query, candidates, top_k=limit * 2)
 
         # Stage 4: Business rules
         candidates = self._apply_diversity(candidates, diversity_limit_per_category)
@@ -766,7 +778,7 @@ class HybridRecommendationEngine:
             "context": "search",
             "user_id": user_id,
             "search_query": query,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
 
     def _empty_response(
@@ -778,5 +790,5 @@ class HybridRecommendationEngine:
             "request_id": request_id,
             "context": context,
             "user_id": user_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": datetime.now(timezone.utc),
         }
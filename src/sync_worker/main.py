@@ -65,6 +65,11 @@ app.conf.beat_schedule = {
         "task": "sync_worker.tasks.update_embeddings.refresh_analytics_views",
         "schedule": crontab(minute=0, hour=2),
     },
+    # Keep monthly user_interactions partitions created ahead, daily at 1 AM
+    "create-interaction-partitions": {
+        "task": "sync_worker.tasks.update_embeddings.create_interaction_partitions",
+        "schedule": crontab(minute=0, hour=1),
+    },
 }
 
 
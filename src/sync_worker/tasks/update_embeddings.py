@@ -1,10 +1,55 @@
 """Embedding update tasks for Pinecone."""
 
+import asyncio
+
 import structlog
 from celery import shared_task
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+try:
+    import uvloop
+except ImportError:  # optional - fall back to the default asyncio loop
+    uvloop = None
+
+from recommendation_service.config import get_settings
 
 logger = structlog.get_logger()
 
+ANALYTICS_VIEWS = ["recommender.product_analytics_daily"]
+
+# Monthly user_interactions partitions are kept this far ahead of the current month
+INTERACTION_PARTITION_MONTHS_AHEAD = 3
+
+
+async def _refresh_views(views: list[str]) -> None:
+    engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+    try:
+        for view in views:
+            # CONCURRENTLY keeps the view readable by the analytics API during the rebuild
+            async with engine.begin() as conn:
+                await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+    finally:
+        await engine.dispose()
+
+
+async def _create_interaction_partitions(months_ahead: int) -> None:
+    engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    SELECT recommender.create_user_interactions_partition(
+                        CAST(LOCALTIMESTAMP + make_interval(months => m) AS date)
+                    )
+                    FROM generate_series(0, :months_ahead) AS m
+                """),
+                {"months_ahead": months_ahead},
+            )
+    finally:
+        await engine.dispose()
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
 def update_stale_embeddings(self) -> dict:
@@ -113,18 +158,49 @@ def refresh_analytics_views(self) -> dict:
     Refresh materialized views for analytics.
 
     This task refreshes:
-    - product_analytics_daily
-    - Any other analytics materialized views
+    - product_analytics_daily (daily interaction counts per product, which
+      picks up the day that just ended)
 
     Returns:
         dict: Refresh result
     """
     logger.info("Refreshing analytics materialized views")
 
-    # TODO: Implement actual view refresh
-    # REFRESH MATERIALIZED VIEW CONCURRENTLY product_analytics_daily;
+    try:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            runner.run(_refresh_views(ANALYTICS_VIEWS))
+    except Exception as e:
+        logger.error("Analytics view refresh failed", error=str(e))
+        raise self.retry(exc=e)
+
+    return {
+        "views_refreshed": ANALYTICS_VIEWS,
+        "success": True,
+    }
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def create_interaction_partitions(self) -> dict:
+    """
+    Create upcoming monthly partitions of user_interactions.
+
+    Partitions are created ahead of time so inserts never fall through to
+    the DEFAULT partition, which would block creating that month's partition.
+    Existing partitions are left untouched.
+
+    Returns:
+        dict: Partition maintenance result
+    """
+    logger.info("Creating user_interactions partitions")
+
+    try:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            runner.run(_create_interaction_partitions(INTERACTION_PARTITION_MONTHS_AHEAD))
+    except Exception as e:
+        logger.error("Interaction partition creation failed", error=str(e))
+        raise self.retry(exc=e)
 
     return {
-        "views_refreshed": ["product_analytics_daily"],
+        "months_ahead": INTERACTION_PARTITION_MONTHS_AHEAD,
         "success": True,
     }
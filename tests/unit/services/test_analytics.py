@@ -0,0 +1,28 @@
+"""Unit tests for analytics period helpers."""
+
+from datetime import date, datetime
+
+from recommendation_service.services.analytics import period_bounds
+
+
+class TestPeriodBounds:
+    """Current period is inclusive of the end date; previous period mirrors its length."""
+
+    def test_single_day(self) -> None:
+        previous_start, current_start, current_end = period_bounds(
+            date(2026, 10, 15), date(2026, 10, 15)
+        )
+        assert current_start == datetime(2026, 10, 15)
+        assert current_end == datetime(2026, 10, 16)
+        assert previous_start == datetime(2026, 10, 14)
+
+    def test_previous_period_matches_length(self) -> None:
+        previous_start, current_start, current_end = period_bounds(
+            date(2026, 10, 1), date(2026, 10, 7)
+        )
+        assert current_end - current_start == current_start - previous_start
+        assert previous_start == datetime(2026, 9, 24)
+
+    def test_bounds_are_naive(self) -> None:
+        bounds = period_bounds(date(2026, 1, 1), date(2026, 1, 31))
+        assert all(b.tzinfo is None for b in bounds)
@@ -0,0 +1,103 @@
+"""Unit tests for the email campaign orchestrator's tick scheduling."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from email_worker.tasks import orchestrator
+from email_worker.tasks.orchestrator import (
+    LAST_TICK_KEY,
+    MAX_CATCH_UP,
+    TICK_MINUTES,
+    _claim_ticks,
+    due_campaigns,
+    tick_of,
+)
+
+TICK = timedelta(minutes=TICK_MINUTES)
+
+# 2026-10-14 is a Wednesday, 2026-10-18 a Sunday
+WEDNESDAY_10AM = datetime(2026, 10, 14, 10, 0, tzinfo=UTC)
+SUNDAY_10AM = datetime(2026, 10, 18, 10, 0, tzinfo=UTC)
+
+
+class FakeRedis:
+    """Just enough of a sync Redis client for the tick claim."""
+
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self.store = store
+
+    def getset(self, key: str, value: str) -> bytes | None:
+        previous = self.store.get(key)
+        self.store[key] = value.encode()
+        return previous
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def redis_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, bytes]:
+    store: dict[str, bytes] = {}
+    monkeypatch.setattr(orchestrator.redis.Redis, "from_url", lambda url: FakeRedis(store))
+    return store
+
+
+def test_tick_of_rounds_down_to_the_quarter_hour() -> None:
+    """Test that a time maps to the start of its 15-minute tick."""
+    assert tick_of(datetime(2026, 10, 14, 10, 7, 33, 120, tzinfo=UTC)) == WEDNESDAY_10AM
+    assert tick_of(WEDNESDAY_10AM + TICK) == WEDNESDAY_10AM + TICK
+
+
+def test_every_tick_runs_cart_abandonment_only() -> None:
+    """Test that an ordinary tick only dispatches cart abandonment."""
+    tick = WEDNESDAY_10AM + TICK
+    assert due_campaigns(tick - TICK, tick) == ["cart_abandonment"]
+
+
+def test_delayed_run_still_gets_daily_campaign() -> None:
+    """Test that a run delayed past 10:00 picks up the 10:00 new products alert."""
+    tick = WEDNESDAY_10AM + 2 * TICK
+    due = due_campaigns(WEDNESDAY_10AM - TICK, tick)
+    assert "new_products" in due
+    assert "weekly_digest" not in due
+
+
+def test_sunday_10am_tick_gets_weekly_digest() -> None:
+    """Test that crontab's Sunday=0 maps onto the Sunday 10:00 tick."""
+    assert due_campaigns(SUNDAY_10AM - TICK, SUNDAY_10AM) == [
+        "cart_abandonment",
+        "weekly_digest",
+        "new_products",
+    ]
+    saturday = SUNDAY_10AM - timedelta(days=1)
+    assert "weekly_digest" not in due_campaigns(saturday - TICK, saturday)
+
+
+def test_six_hourly_tick_gets_personalized_picks() -> None:
+    """Test that personalized picks run on the hours divisible by six."""
+    tick = WEDNESDAY_10AM + timedelta(hours=2)
+    assert due_campaigns(tick - TICK, tick) == ["cart_abandonment", "personalized_picks"]
+
+
+def test_first_claim_covers_only_the_current_tick(redis_store: dict[str, bytes]) -> None:
+    """Test that with no recorded tick the run handles just its own tick."""
+    assert _claim_ticks(WEDNESDAY_10AM) == WEDNESDAY_10AM - TICK
+    assert redis_store[LAST_TICK_KEY] == WEDNESDAY_10AM.isoformat().encode()
+
+
+def test_claim_clamps_long_gaps(redis_store: dict[str, bytes]) -> None:
+    """Test that a backlog longer than MAX_CATCH_UP is clamped."""
+    redis_store[LAST_TICK_KEY] = (WEDNESDAY_10AM - timedelta(days=3)).isoformat().encode()
+    assert _claim_ticks(WEDNESDAY_10AM) == WEDNESDAY_10AM - MAX_CATCH_UP
+
+
+def test_concurrent_claim_gets_nothing(redis_store: dict[str, bytes]) -> None:
+    """Test that a second run claiming the same tick has no campaigns due."""
+    redis_store[LAST_TICK_KEY] = (WEDNESDAY_10AM - TICK).isoformat().encode()
+
+    first = _claim_ticks(WEDNESDAY_10AM)
+    second = _claim_ticks(WEDNESDAY_10AM)
+
+    assert "new_products" in due_campaigns(first, WEDNESDAY_10AM)
+    assert due_campaigns(second, WEDNESDAY_10AM) == []
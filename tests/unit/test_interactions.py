@@ -95,3 +95,31 @@ def test_batch_track_empty_list_fails(client: TestClient) -> None:
         json={"interactions": []},
     )
     assert response.status_code == 400
+
+
+def test_batch_track_rejects_invalid_item(
+    client: TestClient,
+    sample_user_id: str,
+    sample_product_id: str,
+) -> None:
+    """Test that the batch applies per-item validation and names the bad index."""
+    response = client.post(
+        "/api/v1/interactions/batch",
+        json={
+            "interactions": [
+                {
+                    "user_id": sample_user_id,
+                    "product_id": sample_product_id,
+                    "interaction_type": "view",
+                },
+                {
+                    "user_id": sample_user_id,
+                    "interaction_type": "search",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "interactions[1]: search_query is required for search interactions"
+    )
@@ -0,0 +1,290 @@
+"""Unit tests for recommendation endpoints."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from recommendation_service import main
+from recommendation_service.api.v1 import recommendations
+from recommendation_service.api.v1.recommendations import (
+    MAX_CART_PRODUCTS,
+    PUBLIC_CACHE_CONTROL,
+    coalesce,
+    get_recommendation_engine,
+    recommendations_etag,
+    track_search,
+)
+
+PRODUCT = {
+    "product_id": "prod_1",
+    "external_product_id": "prod_1",
+    "name": "Kettle",
+    "category": "Kitchen",
+    "price": 25.0,
+    "image_url": None,
+    "score": 0.9,
+    "position": 1,
+}
+
+
+class FixedEngine:
+    """Engine stand-in returning the same recommendations on every call."""
+
+    def _result(self, context: str, user_id: str | None) -> dict[str, Any]:
+        return {
+            "recommendations": [PRODUCT],
+            "request_id": "req",
+            "context": context,
+            "user_id": user_id,
+            "generated_at": datetime.now(UTC),
+        }
+
+    async def get_homepage_recommendations(self, user_id: str, limit: int) -> dict[str, Any]:
+        return self._result("homepage", user_id)
+
+    async def get_frequently_bought_together(self, product_id: str, limit: int) -> dict[str, Any]:
+        return self._result("frequently_bought_together", None)
+
+    async def get_search_recommendations(
+        self, query: str, user_id: str | None, limit: int, category: str | None
+    ) -> dict[str, Any]:
+        return self._result("search", user_id)
+
+
+@pytest.fixture
+def engine_client(app: Any) -> TestClient:
+    """Test client whose recommendation endpoints use FixedEngine."""
+    app.dependency_overrides[get_recommendation_engine] = FixedEngine
+    return TestClient(app)
+
+
+def test_batch_recommendations_rejects_empty_items(client: TestClient) -> None:
+    """Test that a batch must contain at least one item."""
+    response = client.post("/api/v1/recommendations/batch", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_batch_recommendations_requires_product_id(
+    client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that product contexts require product_id, reported with the item index."""
+    response = client.post(
+        "/api/v1/recommendations/batch",
+        json={
+            "items": [
+                {"context": "homepage", "user_id": sample_user_id},
+                {"context": "product_page", "user_id": sample_user_id},
+            ]
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("items[1]")
+
+
+def test_batch_recommendations_requires_cart_products(
+    client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that cart items require a non-empty cart_product_ids list."""
+    response = client.post(
+        "/api/v1/recommendations/batch",
+        json={"items": [{"context": "cart", "user_id": sample_user_id}]},
+    )
+    assert response.status_code == 400
+
+
+def test_recommendations_etag_is_stable_and_weak() -> None:
+    """Test that equal product lists share a weak ETag and different ones don't."""
+    products = [{"product_id": "p1", "score": 0.9, "position": 1}]
+    etag = recommendations_etag(products)
+    assert etag.startswith('W/"')
+    assert recommendations_etag([dict(p) for p in products]) == etag
+    assert recommendations_etag([{"product_id": "p2", "score": 0.9, "position": 1}]) != etag
+
+
+def test_cart_recommendations_rejects_oversized_cart(
+    client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that oversized carts are rejected before the handler runs."""
+    response = client.get(
+        "/api/v1/recommendations/cart",
+        params={
+            "user_id": sample_user_id,
+            "cart_product_ids": [f"prod_{i}" for i in range(MAX_CART_PRODUCTS + 1)],
+        },
+    )
+    assert response.status_code == 422
+
+
+def test_batch_recommendations_rejects_oversized_cart(
+    client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that batch cart items share the single endpoint's cart size limit."""
+    cart = [f"prod_{i}" for i in range(MAX_CART_PRODUCTS + 1)]
+    response = client.post(
+        "/api/v1/recommendations/batch",
+        json={"items": [{"context": "cart", "user_id": sample_user_id, "cart_product_ids": cart}]},
+    )
+    assert response.status_code == 422
+
+
+async def test_coalesce_shares_one_computation() -> None:
+    """Test that concurrent calls with the same key run the computation once."""
+    calls = 0
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"recommendations": []}
+
+    results = await asyncio.gather(*(coalesce("fbt:p1:4", compute) for _ in range(5)))
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+
+    await coalesce("fbt:p1:4", compute)
+    assert calls == 2
+
+
+async def test_coalesce_propagates_errors_to_followers() -> None:
+    """Test that a failed computation fails every waiting caller."""
+
+    async def compute() -> dict:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("engine failed")
+
+    results = await asyncio.gather(
+        *(coalesce("similar:p1:8", compute) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_coalesce_survives_cancelled_leader() -> None:
+    """Test that a follower still gets a result when the leader is cancelled."""
+    calls = 0
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"recommendations": [calls]}
+
+    leader = asyncio.create_task(coalesce("similar:p2:8", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(coalesce("similar:p2:8", compute))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await follower == {"recommendations": [2]}
+    assert leader.cancelled()
+    assert calls == 2
+
+
+def test_matching_if_none_match_returns_not_modified(
+    engine_client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that a client holding the current ETag gets an empty 304."""
+    url = "/api/v1/recommendations/homepage"
+    first = engine_client.get(url, params={"user_id": sample_user_id})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag == recommendations_etag([PRODUCT])
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"].startswith("private, max-age=")
+
+    second = engine_client.get(
+        url, params={"user_id": sample_user_id}, headers={"If-None-Match": f'W/"stale", {etag}'}
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert second.headers["cache-control"] == first.headers["cache-control"]
+
+
+def test_stale_if_none_match_returns_recommendations(
+    engine_client: TestClient,
+    sample_user_id: str,
+) -> None:
+    """Test that a non-matching ETag gets the full response."""
+    response = engine_client.get(
+        "/api/v1/recommendations/homepage",
+        params={"user_id": sample_user_id},
+        headers={"If-None-Match": 'W/"stale"'},
+    )
+    assert response.status_code == 200
+    assert response.json()["recommendations"] == [PRODUCT]
+
+
+def test_frequently_bought_together_is_publicly_cacheable(
+    engine_client: TestClient,
+    sample_product_id: str,
+) -> None:
+    """Test that non-personalized recommendations use the shared cache policy."""
+    response = engine_client.get(
+        f"/api/v1/recommendations/frequently-bought-together/{sample_product_id}"
+    )
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == PUBLIC_CACHE_CONTROL
+
+
+def test_track_search_drops_events_when_queue_is_full(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a full tracking queue drops searches instead of blocking the request."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    monkeypatch.setattr(recommendations, "_search_events", queue)
+
+    track_search("user-1", "kettle", "req-1")
+    track_search("user-2", "teapot", "req-2")
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == ("user-1", "SEARCH", "kettle", "req-1")
+
+
+def test_search_tracker_drains_and_flushes_on_shutdown(
+    app: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the lifespan's tracker writes queued searches and flushes on shutdown."""
+    written: list[list[tuple]] = []
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_copy_records(session: Any, table: str, columns: Any, records: Any) -> None:
+        written.append(list(records))
+
+    monkeypatch.setattr("recommendation_service.services.embedding.get_embedding_model", lambda: None)
+    monkeypatch.setattr(recommendations, "get_autocommit_session_factory", lambda: fake_session)
+    monkeypatch.setattr(recommendations, "copy_records", fake_copy_records)
+    # A long interval keeps the second search queued until shutdown
+    monkeypatch.setattr(
+        main, "start_search_tracker", partial(recommendations.start_search_tracker, interval=60)
+    )
+    app.dependency_overrides[get_recommendation_engine] = FixedEngine
+
+    with TestClient(app) as client:
+        client.get("/api/v1/recommendations/search", params={"query": "kettle", "user_id": "u1"})
+        deadline = time.monotonic() + 5
+        while not written and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert written == [[("u1", "SEARCH", "kettle", "req")]]
+
+        client.get("/api/v1/recommendations/search", params={"query": "teapot", "user_id": "u2"})
+
+    assert written == [
+        [("u1", "SEARCH", "kettle", "req")],
+        [("u2", "SEARCH", "teapot", "req")],
+    ]
+    assert recommendations._search_events is None